@@ -4,11 +4,15 @@ from typing import List, Optional
 from datetime import datetime
 import logging
 from bs4 import BeautifulSoup, Tag
-from .base_scraper import BaseScraper
+from .base_scraper import (
+    BaseScraper, DAY_MONTH_RE, PRICE_RE, RANGE_SPLIT_RE, URL_SUFFIX_RE, YEAR_RE,
+)
 from ..base import EventData
 
 logger = logging.getLogger(__name__)
 
+_DATE_CLASS_RE = re.compile(r"date", re.IGNORECASE)
+
 
 class AlexandraPalaceScraper(BaseScraper):
     """
@@ -118,7 +122,7 @@ class AlexandraPalaceScraper(BaseScraper):
 
         # Source ID from URL slug
         source_id = event_url.rstrip("/").split("/")[-1]
-        source_id = re.sub(r"[?#].*", "", source_id)
+        source_id = URL_SUFFIX_RE.sub("", source_id)
         if not source_id:
             return None
 
@@ -129,7 +133,7 @@ class AlexandraPalaceScraper(BaseScraper):
             start_date = self._parse_date_text(date_elem.get_text(strip=True))
         # Fallback: look for any date-like text in the card
         if start_date is None:
-            for elem in card.find_all(class_=re.compile(r"date", re.IGNORECASE)):
+            for elem in card.find_all(class_=_DATE_CLASS_RE):
                 start_date = self._parse_date_text(elem.get_text(strip=True))
                 if start_date:
                     break
@@ -180,21 +184,17 @@ class AlexandraPalaceScraper(BaseScraper):
             return None
 
         # Split on dash/en-dash to handle ranges
-        parts = re.split(r"[–\-]", text, maxsplit=1)
+        parts = RANGE_SPLIT_RE.split(text, maxsplit=1)
         start_text = parts[0].strip()
 
         # Get year from end part if start doesn't have it
         year = None
         if len(parts) > 1:
-            year_match = re.search(r"(\d{4})", parts[1])
+            year_match = YEAR_RE.search(parts[1])
             if year_match:
                 year = int(year_match.group(1))
 
-        match = re.search(
-            r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*(?:\s+(\d{4}))?",
-            start_text,
-            re.IGNORECASE,
-        )
+        match = DAY_MONTH_RE.search(start_text)
         if match:
             try:
                 day = int(match.group(1))
@@ -210,23 +210,14 @@ class AlexandraPalaceScraper(BaseScraper):
 
         return None
 
-    def _month_to_int(self, month_text: str) -> Optional[int]:
-        """Convert month abbreviation to integer."""
-        months = {
-            "jan": 1, "feb": 2, "mar": 3, "apr": 4,
-            "may": 5, "jun": 6, "jul": 7, "aug": 8,
-            "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-        }
-        return months.get(month_text.lower().strip()[:3])
-
     def _parse_price(self, card: Tag) -> tuple:
         """Extract price from card. Returns (min_price, max_price)."""
         text = card.get_text()
         if "free" in text.lower():
             return 0.0, 0.0
-        prices = re.findall(r"£(\d+(?:\.\d{2})?)", text)
+        prices = PRICE_RE.findall(text)
         if prices:
-            float_prices = [float(p) for p in prices]
+            float_prices = list(map(float, prices))
             return min(float_prices), max(float_prices)
         return None, None
 
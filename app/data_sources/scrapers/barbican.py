@@ -1,10 +1,11 @@
 """Barbican Centre web scraper."""
-import re
 from typing import List, Optional, Tuple
 from datetime import datetime
 import logging
 from bs4 import BeautifulSoup, Tag
-from .base_scraper import BaseScraper
+from .base_scraper import (
+    BaseScraper, DAY_MONTH_RE, RANGE_SPLIT_RE, URL_SUFFIX_RE, YEAR_RE,
+)
 from ..base import EventData
 
 logger = logging.getLogger(__name__)
@@ -117,7 +118,7 @@ class BarbicanScraper(BaseScraper):
 
         # Generate source ID from URL path
         source_id = event_url.rstrip("/").split("/")[-1]
-        source_id = re.sub(r"[?#].*", "", source_id)
+        source_id = URL_SUFFIX_RE.sub("", source_id)
         if not source_id:
             return None
 
@@ -219,21 +220,17 @@ class BarbicanScraper(BaseScraper):
             return None
 
         # Split on dash/en-dash to get start date
-        parts = re.split(r"[–\-]", text, maxsplit=1)
+        parts = RANGE_SPLIT_RE.split(text, maxsplit=1)
         start_text = parts[0].strip()
         # If start doesn't have year, get year from end part
         year = None
         if len(parts) > 1:
-            year_match = re.search(r"(\d{4})", parts[1])
+            year_match = YEAR_RE.search(parts[1])
             if year_match:
                 year = int(year_match.group(1))
 
         # Parse "Fri 30 Jan" or "30 Jan 2026"
-        match = re.search(
-            r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*(?:\s+(\d{4}))?",
-            start_text,
-            re.IGNORECASE,
-        )
+        match = DAY_MONTH_RE.search(start_text)
         if match:
             try:
                 day = int(match.group(1))
@@ -249,15 +246,6 @@ class BarbicanScraper(BaseScraper):
 
         return None
 
-    def _month_to_int(self, month_text: str) -> Optional[int]:
-        """Convert month abbreviation to integer."""
-        months = {
-            "jan": 1, "feb": 2, "mar": 3, "apr": 4,
-            "may": 5, "jun": 6, "jul": 7, "aug": 8,
-            "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-        }
-        return months.get(month_text.lower().strip()[:3])
-
     def _map_category(self, tag_text: str) -> Optional[str]:
         """Map Barbican tag text to standardized category."""
         mapping = {
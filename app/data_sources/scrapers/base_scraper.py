@@ -1,4 +1,5 @@
 """Base class for web scraping data sources."""
+import re
 import time
 import logging
 from abc import abstractmethod
@@ -10,6 +11,24 @@ from ...config import settings
 
 logger = logging.getLogger(__name__)
 
+# Month names and abbreviations share their first three letters
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4,
+    "may": 5, "jun": 6, "jul": 7, "aug": 8,
+    "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# Listing-text patterns shared by the venue scrapers
+URL_SUFFIX_RE = re.compile(r"[?#].*")  # query string / fragment on a URL slug
+RANGE_SPLIT_RE = re.compile(r"[\u2013\-]")  # en-dash or hyphen between range ends
+YEAR_RE = re.compile(r"(\d{4})")
+PRICE_RE = re.compile(r"£(\d+(?:\.\d{2})?)")  # only £-prefixed amounts, not stray numbers
+# "14 Feb" / "14 February 2026"; the year group is optional
+DAY_MONTH_RE = re.compile(
+    r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*(?:\s+(\d{4}))?",
+    re.IGNORECASE,
+)
+
 
 class BaseScraper(BaseDataSource):
     """
@@ -87,6 +106,10 @@ class BaseScraper(BaseDataSource):
             logger.error(f"Error parsing HTML: {e}")
             return None
 
+    def _month_to_int(self, month_text: str) -> Optional[int]:
+        """Convert a month name or abbreviation ('Feb', 'February') to an integer."""
+        return _MONTHS.get(month_text.strip()[:3].lower())
+
     def get_rate_limit_delay(self) -> float:
         """
         Get delay between requests.
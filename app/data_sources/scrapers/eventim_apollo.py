@@ -4,11 +4,19 @@ from typing import List, Optional
 from datetime import datetime
 import logging
 from bs4 import BeautifulSoup, Tag
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, PRICE_RE, RANGE_SPLIT_RE, URL_SUFFIX_RE, YEAR_RE
 from ..base import EventData
 
 logger = logging.getLogger(__name__)
 
+_ORDINAL_RE = re.compile(r"(\d+)(?:st|nd|rd|th)")
+# "20 February" or "Feb 26"; the named groups say which form matched
+_DATE_RE = re.compile(
+    r"(?P<day>\d{1,2})\s+(?P<month>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*"
+    r"|(?P<month_first>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(?P<day_second>\d{1,2})",
+    re.IGNORECASE,
+)
+
 
 class EventimApolloScraper(BaseScraper):
     """
@@ -115,7 +123,7 @@ class EventimApolloScraper(BaseScraper):
             return None
 
         # Source ID from URL path (strip query params first)
-        clean_url = re.sub(r"[?#].*", "", event_url)
+        clean_url = URL_SUFFIX_RE.sub("", event_url)
         source_id = clean_url.rstrip("/").split("/")[-1]
         if not source_id:
             return None
@@ -182,76 +190,49 @@ class EventimApolloScraper(BaseScraper):
             return None
 
         # Strip ordinal suffixes (st, nd, rd, th) from numbers
-        cleaned = re.sub(r"(\d+)(?:st|nd|rd|th)", r"\1", text)
+        cleaned = _ORDINAL_RE.sub(r"\1", text)
 
         # Split on dash/en-dash to handle ranges
-        parts = re.split(r"[\u2013\-]", cleaned, maxsplit=1)
+        parts = RANGE_SPLIT_RE.split(cleaned, maxsplit=1)
         start_text = parts[0].strip()
         end_text = parts[1].strip() if len(parts) > 1 else ""
 
         # Get year from end part if start doesn't have it
         year = None
         for search_text in [start_text, end_text]:
-            year_match = re.search(r"(\d{4})", search_text)
+            year_match = YEAR_RE.search(search_text)
             if year_match:
                 year = int(year_match.group(1))
                 break
+        # No year means no date; skip the day/month match entirely
+        if year is None:
+            return None
 
-        # Try "day month" pattern: "20 February" or "Friday 20 February"
-        match = re.search(
-            r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*",
-            start_text,
-            re.IGNORECASE,
-        )
-        # Try "month day" pattern: "Feb 26" or "Mar 3"
+        # "20 February" / "Friday 20 February" or "Feb 26" / "Mar 3", in one pass
+        match = _DATE_RE.search(start_text)
         if not match:
-            match = re.search(
-                r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{1,2})",
-                start_text,
-                re.IGNORECASE,
-            )
-            if match:
-                month = self._month_to_int(match.group(1))
-                day = int(match.group(2))
-                if year is None:
-                    return None
-                if month:
-                    try:
-                        return datetime(year, month, day)
-                    except ValueError:
-                        return None
-                return None
-
-        if match:
-            try:
-                day = int(match.group(1))
-                month = self._month_to_int(match.group(2))
-                if year is None:
-                    return None
-                if month:
-                    return datetime(year, month, day)
-            except (ValueError, TypeError):
-                pass
-
-        return None
-
-    def _month_to_int(self, month_text: str) -> Optional[int]:
-        """Convert month abbreviation to integer."""
-        months = {
-            "jan": 1, "feb": 2, "mar": 3, "apr": 4,
-            "may": 5, "jun": 6, "jul": 7, "aug": 8,
-            "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-        }
-        return months.get(month_text.lower().strip()[:3])
+            return None
+        if match.group("day"):
+            day, month_text = match.group("day", "month")
+        else:
+            day, month_text = match.group("day_second", "month_first")
+
+        month = self._month_to_int(month_text)
+        if not month:
+            return None
+        try:
+            return datetime(year, month, int(day))
+        except ValueError:
+            return None
 
     def _parse_price(self, card: Tag) -> tuple:
         """Extract price from card. Returns (min_price, max_price)."""
         text = card.get_text()
         if "free" in text.lower():
             return 0.0, 0.0
-        prices = re.findall(r"£(\d+(?:\.\d{2})?)", text)
+        prices = PRICE_RE.findall(text)
         if prices:
-            float_prices = [float(p) for p in prices]
+            float_prices = list(map(float, prices))
             return min(float_prices), max(float_prices)
         return None, None
 
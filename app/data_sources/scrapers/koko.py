@@ -10,6 +10,12 @@ from ..base import EventData
 
 logger = logging.getLogger(__name__)
 
+# Listing dates come as "February 14, 2026" or "14 February 2026"; the
+# leading character picks the candidate formats so only one usually runs
+_MONTH_FIRST_FORMATS = ("%B %d, %Y", "%b %d, %Y")
+_DAY_FIRST_FORMATS = ("%d %B %Y", "%d %b %Y")
+_DOOR_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})\s*(am|pm)", re.IGNORECASE)
+
 
 class KokoScraper(BaseScraper):
     """
@@ -223,15 +229,12 @@ class KokoScraper(BaseScraper):
         if not date_str or not isinstance(date_str, str):
             return None
         date_str = date_str.strip()
-        try:
-            return datetime.strptime(date_str, "%B %d, %Y")
-        except ValueError:
-            pass
-        # Try alternate format: "14 February 2026"
-        try:
-            return datetime.strptime(date_str, "%d %B %Y")
-        except ValueError:
-            pass
+        formats = _DAY_FIRST_FORMATS if date_str[:1].isdigit() else _MONTH_FIRST_FORMATS
+        for fmt in formats:
+            try:
+                return datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
         logger.debug(f"KOKO: Could not parse date '{date_str}'")
         return None
 
@@ -239,7 +242,7 @@ class KokoScraper(BaseScraper):
         """Parse door time like '10:00 pm'. Returns (hour, minute) or None."""
         if not time_str:
             return None
-        match = re.match(r"(\d{1,2}):(\d{2})\s*(am|pm)", time_str.strip(), re.IGNORECASE)
+        match = _DOOR_TIME_RE.match(time_str.strip())
         if match:
             hour = int(match.group(1))
             minute = int(match.group(2))
@@ -4,11 +4,16 @@ from typing import List, Optional, Tuple
 from datetime import datetime
 import logging
 from bs4 import BeautifulSoup, Tag
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, PRICE_RE, URL_SUFFIX_RE
 from ..base import EventData
 
 logger = logging.getLogger(__name__)
 
+_DATE_RE = re.compile(
+    r"(\d{1,2})\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s*(\d{4})",
+    re.IGNORECASE,
+)
+
 
 class O2ArenaScraper(BaseScraper):
     """
@@ -123,7 +128,7 @@ class O2ArenaScraper(BaseScraper):
 
         # Generate source ID from URL
         source_id = event_url.rstrip("/").split("/")[-1]
-        source_id = re.sub(r"[?#].*", "", source_id)
+        source_id = URL_SUFFIX_RE.sub("", source_id)
         if not source_id:
             return None
 
@@ -253,23 +258,10 @@ class O2ArenaScraper(BaseScraper):
             logger.debug(f"Failed to construct date from day={day_text} month={month_text} year={year_text}: {e}")
             return None
 
-    def _month_to_int(self, month_text: str) -> Optional[int]:
-        """Convert month abbreviation to integer."""
-        months = {
-            "jan": 1, "feb": 2, "mar": 3, "apr": 4,
-            "may": 5, "jun": 6, "jul": 7, "aug": 8,
-            "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-        }
-        return months.get(month_text.lower().strip()[:3])
-
     def _parse_date_text(self, date_text: str) -> Optional[datetime]:
         """Parse a date string like '13 Feb 2026' or '13Feb2026'."""
         # Try pattern: day month year (with or without spaces)
-        match = re.search(
-            r"(\d{1,2})\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s*(\d{4})",
-            date_text,
-            re.IGNORECASE,
-        )
+        match = _DATE_RE.search(date_text)
         if match:
             try:
                 day = int(match.group(1))
@@ -292,9 +284,9 @@ class O2ArenaScraper(BaseScraper):
                 return 0.0, 0.0
 
             # Only match prices with £ sign to avoid matching random numbers
-            prices = re.findall(r"£(\d+(?:\.\d{2})?)", price_text)
+            prices = PRICE_RE.findall(price_text)
             if prices:
-                float_prices = [float(p) for p in prices]
+                float_prices = list(map(float, prices))
                 return min(float_prices), max(float_prices)
         except (ValueError, TypeError) as e:
             logger.debug(f"Could not parse price '{price_text}': {e}")
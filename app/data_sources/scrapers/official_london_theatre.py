@@ -236,10 +236,11 @@ class OfficialLondonTheatreScraper(BaseScraper):
         if not date_str or not isinstance(date_str, str):
             return None
         date_str = date_str.strip()
-        if len(date_str) != 8:
+        if len(date_str) != 8 or not date_str.isdigit():
             return None
+        # Fixed-width digits: slicing is much cheaper than strptime
         try:
-            return datetime.strptime(date_str, "%Y%m%d")
+            return datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
         except ValueError:
             return None
 
@@ -1,10 +1,9 @@
 """Resident Advisor event source via GraphQL API."""
-import re
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import logging
 import httpx
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, PRICE_RE
 from ..base import EventData
 from ...config import settings
 
@@ -269,7 +268,7 @@ class ResidentAdvisorScraper(BaseScraper):
         price_max = None
         cost = data.get("cost", "")
         if cost and isinstance(cost, str):
-            prices = re.findall(r"£(\d+(?:\.\d{2})?)", cost)
+            prices = PRICE_RE.findall(cost)
             if prices:
                 price_min = float(prices[0])
                 if len(prices) > 1:
@@ -309,26 +308,22 @@ class ResidentAdvisorScraper(BaseScraper):
 
         value = value.strip()
 
-        # ISO 8601 format (e.g. "2026-02-14T22:00:00.000")
-        for fmt in (
-            "%Y-%m-%dT%H:%M:%S.%f",
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-        ):
+        # Unix timestamp as string
+        if value.isdigit():
             try:
-                return datetime.strptime(value, fmt)
-            except ValueError:
-                continue
+                return datetime.fromtimestamp(int(value))
+            except (ValueError, OSError, OverflowError):
+                return None
 
-        # Unix timestamp as string
+        # ISO 8601 (e.g. "2026-02-14T22:00:00.000Z"); fromisoformat is C-backed,
+        # unlike a strptime loop that raises once per rejected format
         try:
-            ts = int(value)
-            return datetime.fromtimestamp(ts)
-        except (ValueError, OSError, OverflowError):
-            pass
+            parsed = datetime.fromisoformat(value.removesuffix("Z"))
+        except ValueError:
+            parsed = None
+        # Offset-qualified strings were never accepted; keep dates naive
+        if parsed is not None and parsed.tzinfo is None:
+            return parsed
 
         logger.debug(f"RA: Could not parse date '{value}'")
         return None
@@ -4,11 +4,17 @@ from typing import List, Optional
 from datetime import datetime
 import logging
 from bs4 import BeautifulSoup, Tag
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, RANGE_SPLIT_RE, URL_SUFFIX_RE, YEAR_RE
 from ..base import EventData
 
 logger = logging.getLogger(__name__)
 
+_SHORT_YEAR_RE = re.compile(
+    r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{2})\b", re.IGNORECASE
+)
+_MONTH_RE = re.compile(r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*", re.IGNORECASE)
+_DAY_RE = re.compile(r"(\d{1,2})")
+
 
 class RoundhouseScraper(BaseScraper):
     """
@@ -111,7 +117,7 @@ class RoundhouseScraper(BaseScraper):
 
         # Source ID from URL slug
         source_id = event_url.rstrip("/").split("/")[-1]
-        source_id = re.sub(r"[?#].*", "", source_id)
+        source_id = URL_SUFFIX_RE.sub("", source_id)
         if not source_id:
             return None
 
@@ -166,7 +172,7 @@ class RoundhouseScraper(BaseScraper):
             return None
 
         # Split on dash/en-dash/special chars to handle ranges — take start
-        parts = re.split(r"[\u2013\-]", text, maxsplit=1)
+        parts = RANGE_SPLIT_RE.split(text, maxsplit=1)
         start_text = parts[0].strip()
         end_text = parts[1].strip() if len(parts) > 1 else ""
 
@@ -174,12 +180,12 @@ class RoundhouseScraper(BaseScraper):
         year = None
         for search_text in [start_text, end_text]:
             # 4-digit year
-            y4 = re.search(r"(\d{4})", search_text)
+            y4 = YEAR_RE.search(search_text)
             if y4:
                 year = int(y4.group(1))
                 break
             # 2-digit year (e.g., "Feb 26")
-            y2 = re.search(r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{2})\b", search_text, re.IGNORECASE)
+            y2 = _SHORT_YEAR_RE.search(search_text)
             if y2:
                 year = 2000 + int(y2.group(1))
                 break
@@ -187,13 +193,13 @@ class RoundhouseScraper(BaseScraper):
         # Try to find month in start text first, then end text
         month = None
         for search_text in [start_text, end_text]:
-            m = re.search(r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*", search_text, re.IGNORECASE)
+            m = _MONTH_RE.search(search_text)
             if m:
                 month = self._month_to_int(m.group(1))
                 break
 
         # Find day number in start text
-        day_match = re.search(r"(\d{1,2})", start_text)
+        day_match = _DAY_RE.search(start_text)
         if not day_match or not month:
             return None
         day = int(day_match.group(1))
@@ -208,15 +214,6 @@ class RoundhouseScraper(BaseScraper):
         except ValueError:
             return None
 
-    def _month_to_int(self, month_text: str) -> Optional[int]:
-        """Convert month abbreviation to integer."""
-        months = {
-            "jan": 1, "feb": 2, "mar": 3, "apr": 4,
-            "may": 5, "jun": 6, "jul": 7, "aug": 8,
-            "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-        }
-        return months.get(month_text.lower().strip()[:3])
-
     def _determine_category(self, title: str) -> str:
         """Determine event category from title."""
         title_lower = title.lower()
@@ -2,7 +2,7 @@
 from datetime import datetime
 from sqlalchemy import (
     Column, Integer, String, DateTime, Boolean,
-    Text, Float, ForeignKey, Table, JSON, Enum as SQLEnum
+    Text, Float, ForeignKey, Table, JSON, Index, Enum as SQLEnum, text
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -52,6 +52,7 @@ class Event(Base):
 
     # Basic Info
     title = Column(String(500), nullable=False)
+    title_normalized = Column(String(500), index=True)  # NFKC + casefold, for dedup
     description = Column(Text)
     slug = Column(String(500), index=True)
 
@@ -62,6 +63,7 @@ class Event(Base):
 
     # Location
     venue_name = Column(String(255))
+    venue_normalized = Column(String(255))  # NFKC + casefold, for dedup
     venue_address = Column(Text)
     latitude = Column(Float)
     longitude = Column(Float)
@@ -104,6 +106,16 @@ class Event(Base):
     # Relationships
     categories = relationship("Category", secondary=event_categories, back_populates="events")
 
+    __table_args__ = (
+        # Upcoming selling-fast lookups (stats, manual alerts); enum stored by name
+        Index(
+            "ix_events_selling_fast_start_date",
+            "start_date",
+            postgresql_where=text("status = 'SELLING_FAST'"),
+            sqlite_where=text("status = 'SELLING_FAST'"),
+        ),
+    )
+
 
 class AvailabilityHistory(Base):
     """Tracks status changes for sellout monitoring."""
@@ -120,6 +132,11 @@ class AvailabilityHistory(Base):
 
     event = relationship("Event")
 
+    __table_args__ = (
+        # Latest-transition-per-event lookup in SelloutMonitor
+        Index("ix_availability_history_event_recorded", "event_id", "recorded_at"),
+    )
+
 
 class DataSource(Base):
     """Data source tracking for monitoring and health checks."""
@@ -134,7 +151,9 @@ class DataSource(Base):
     last_error = Column(Text)
     events_fetched_count = Column(Integer, default=0)
     success_rate = Column(Float, default=1.0)
-    average_fetch_time = Column(Float)  # Seconds
+    average_fetch_time = Column(Float)  # Seconds, total_fetch_time / successful_fetch_count
+    total_fetch_time = Column(Float, default=0.0)  # Seconds, summed over successful fetches
+    successful_fetch_count = Column(Integer, default=0)
     source_metadata = Column("metadata", JSON)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
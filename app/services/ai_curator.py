@@ -1,8 +1,10 @@
 """AI-powered editorial curation using Anthropic Claude API."""
+import heapq
 import logging
-import json
 from typing import List, Dict, Optional
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 
 from ..config import settings
 from ..models.database import Event, EventStatus
@@ -10,6 +12,70 @@ from ..models.database import Event, EventStatus
 logger = logging.getLogger(__name__)
 
 
+# Two-letter category codes used in the compact prompt table (see seed_data.py)
+_CATEGORY_CODES = {
+    "Music": "MU",
+    "Theatre": "TH",
+    "Comedy": "CO",
+    "Sports": "SP",
+    "Arts": "AR",
+    "Film": "FI",
+    "Food": "FO",
+    "Family": "FA",
+    "Festival": "FE",
+    "Nightlife": "NI",
+    "Business": "BU",
+    "Tech": "TE",
+    "Wellness": "WE",
+    "Education": "ED",
+    "Community": "CM",
+    "Other": "OT",
+}
+
+_PROMPT_LEGEND = (
+    "Columns are tab-separated. Prices are whole GBP; blank means unknown.\n"
+    "status: F = selling fast, S = sold out, blank = available.\n"
+    "cats: " + ", ".join(f"{code}={name}" for name, code in _CATEGORY_CODES.items())
+)
+
+# Tool the model is forced to call, so picks come back as validated structured input
+_SUBMIT_PICKS_TOOL = {
+    "name": "submit_picks",
+    "description": "Submit the selected editor's picks with an editorial note for each.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "picks": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "event_id": {"type": "integer"},
+                        "editorial_note": {"type": "string"},
+                    },
+                    "required": ["event_id", "editorial_note"],
+                },
+            },
+        },
+        "required": ["picks"],
+    },
+}
+
+_PROMPT_HEADER = "id\ttitle\tvenue\tdate\tpmin\tpmax\tstatus\tcats"
+
+# Status column codes; any other status is left blank
+_PROMPT_STATUS = {EventStatus.SELLING_FAST: "F", EventStatus.SOLD_OUT: "S"}
+
+# Free-text columns may contain tabs; flatten them so the TSV stays aligned
+_TABS_TO_SPACES = str.maketrans("\t", " ")
+
+
+@lru_cache(maxsize=4096)
+def _fmt_prompt(date: datetime) -> str:
+    """Format a date for the curation prompt, e.g. '14 Mar'."""
+    return date.strftime("%d %b")
+
+
 class AICurator:
     """
     LLM-powered editorial curation for the newsletter.
@@ -23,12 +89,20 @@ class AICurator:
 
     def __init__(self):
         self.api_key = settings.anthropic_api_key
+        self._client = None
 
     def _get_client(self):
-        """Get Anthropic client (lazy import to avoid issues when key is missing)."""
-        import anthropic
+        """
+        Get Anthropic client (lazy import to avoid issues when key is missing).
 
-        return anthropic.Anthropic(api_key=self.api_key)
+        Built once per curator so the picks, intro and section-intro calls
+        share one HTTP connection pool.
+        """
+        if self._client is None:
+            import anthropic
+
+            self._client = anthropic.Anthropic(api_key=self.api_key)
+        return self._client
 
     def curate_editors_picks(
         self, events: List[Event], max_picks: int = 5
@@ -47,6 +121,7 @@ class AICurator:
             logger.warning("No Anthropic API key — using fallback pick selection")
             return self._fallback_picks(events, max_picks)
 
+        valid_ids = frozenset(e.id for e in events)
         event_summaries = self._format_events_for_prompt(events[:80])
 
         prompt = f"""You are an editorial curator for a London events newsletter.
@@ -63,30 +138,32 @@ For each pick, write a 1-2 sentence editorial note explaining why it's worth att
 Be specific and opinionated — not generic marketing copy.
 
 EVENTS:
+{_PROMPT_LEGEND}
+
 {event_summaries}
 
-Respond with valid JSON only — an array of objects with "event_id" (integer) and "editorial_note" (string).
-Example: [{{"event_id": 42, "editorial_note": "The RSC rarely brings full productions to the Barbican — this is a genuine once-a-year opportunity."}}]"""
+Submit your picks with the submit_picks tool, using the id column as event_id.
+Example note: The RSC rarely brings full productions to the Barbican — this is a genuine once-a-year opportunity."""
 
         try:
             client = self._get_client()
             response = client.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=1500,
+                tools=[_SUBMIT_PICKS_TOOL],
+                tool_choice={"type": "tool", "name": "submit_picks"},
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            text = response.content[0].text.strip()
-            # Extract JSON from response (handle markdown code blocks)
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-                text = text.strip()
+            tool_use = next(
+                (b for b in response.content if b.type == "tool_use"), None
+            )
+            if tool_use is None:
+                raise ValueError("Response has no submit_picks tool call")
 
-            picks = json.loads(text)
-            valid_ids = {e.id for e in events}
-            picks = [p for p in picks if p.get("event_id") in valid_ids]
+            picks = [
+                p for p in tool_use.input["picks"] if p.get("event_id") in valid_ids
+            ]
 
             logger.info(f"AI selected {len(picks)} editor's picks")
             return picks[:max_picks]
@@ -168,31 +245,25 @@ Just the paragraph — no heading, no greeting."""
             return self._fallback_newsletter_intro(total_events)
 
     def _format_events_for_prompt(self, events: List[Event]) -> str:
-        """Format events as a compact text list for the LLM prompt."""
-        lines = []
-        for e in events:
-            price = ""
-            if e.price_min is not None:
-                price = f" | £{e.price_min:.0f}"
-                if e.price_max and e.price_max != e.price_min:
-                    price += f"-£{e.price_max:.0f}"
-            elif e.price_max is not None:
-                price = f" | up to £{e.price_max:.0f}"
-
-            status_tag = ""
-            if e.status == EventStatus.SELLING_FAST:
-                status_tag = " [SELLING FAST]"
-            elif e.status == EventStatus.SOLD_OUT:
-                status_tag = " [SOLD OUT]"
-
-            venue = e.venue_name or "Venue TBA"
-            date = e.start_date.strftime("%d %b")
+        """Format events as a compact tab-separated table for the LLM prompt."""
+        lines = [_PROMPT_HEADER]
+        append = lines.append
+        codes = _CATEGORY_CODES
+        status_codes = _PROMPT_STATUS
+        tabs = _TABS_TO_SPACES
 
-            categories = ", ".join(c.name for c in e.categories) if e.categories else ""
-            cat_str = f" ({categories})" if categories else ""
-
-            lines.append(
-                f"ID:{e.id} | {e.title} | {venue} | {date}{price}{status_tag}{cat_str}"
+        for e in events:
+            price_min = e.price_min
+            price_max = e.price_max
+            pmin = "" if price_min is None else f"{price_min:.0f}"
+            pmax = "" if price_max is None else f"{price_max:.0f}"
+            venue = (e.venue_name or "").translate(tabs)
+            cats = ",".join(codes.get(c.name, c.name) for c in e.categories or ())
+
+            append(
+                f"{e.id}\t{e.title.translate(tabs)}\t{venue}\t"
+                f"{_fmt_prompt(e.start_date)}\t{pmin}\t{pmax}\t"
+                f"{status_codes.get(e.status, '')}\t{cats.translate(tabs)}"
             )
 
         return "\n".join(lines)
@@ -212,10 +283,9 @@ Just the paragraph — no heading, no greeting."""
                 score += 50
             scored.append((score, e))
 
-        scored.sort(key=lambda x: x[0], reverse=True)
-
+        # Top-k selection; same ordering (ties included) as a full stable sort
         picks = []
-        for _, event in scored[:max_picks]:
+        for _, event in heapq.nlargest(max_picks, scored, key=itemgetter(0)):
             picks.append(
                 {
                     "event_id": event.id,
@@ -1,15 +1,66 @@
 """Generate Substack-compatible HTML newsletter content."""
+import bisect
+import io
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
-from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby, islice
+from operator import itemgetter
 
 from ..models.database import Event, EventStatus
 from .sellout_detector import SelloutDetector
-from .ai_curator import AICurator
 
 logger = logging.getLogger(__name__)
 
+# Price-tier sections: (heading, inclusive upper bound on price_min)
+_PRICE_TIERS = (
+    ("Free Events", 0),
+    ("Under £20", 20),
+    ("Premium Experiences", float("inf")),
+)
+_PRICE_TIER_BOUNDS = tuple(bound for _, bound in _PRICE_TIERS)
+
+# Columns the renderers and AI curator read; callers pass these to load_only()
+# so large fields (description, raw_data, images) stay on the server
+CONTENT_COLUMNS = (
+    Event.id,
+    Event.title,
+    Event.start_date,
+    Event.venue_name,
+    Event.status,
+    Event.ticket_url,
+    Event.price_min,
+    Event.price_max,
+    Event.currency,
+    Event.tickets_available,
+    Event.availability_percentage,
+    Event.first_seen_at,
+    Event.is_featured,
+    Event.popularity_score,
+)
+
+_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+
+def _esc(s: Optional[str]) -> str:
+    """HTML-escape user-derived text in a single C-level pass."""
+    return s.translate(_ESCAPE_TABLE) if s else ""
+
+
+@lru_cache(maxsize=4096)
+def _fmt_short(date: datetime) -> str:
+    """Format a date for event cards, e.g. 'Sat 14 Mar'."""
+    return date.strftime("%a %d %b")
+
+
+@lru_cache(maxsize=4096)
+def _fmt_long(date: datetime) -> str:
+    """Format a date for editor's pick cards, e.g. 'Saturday 14 March'."""
+    return date.strftime("%A %d %B")
+
 
 class ContentGenerator:
     """
@@ -29,7 +80,19 @@ class ContentGenerator:
 
     def __init__(self):
         self.sellout_detector = SelloutDetector()
-        self.ai_curator = AICurator()
+        self._ai_curator = None
+        # Per-render caches keyed on id(event); emptied when each render ends
+        self._price_cache: Dict[int, str] = {}
+        self._urgency_cache: Dict[int, str] = {}
+
+    @property
+    def ai_curator(self):
+        """AI curator, imported on first use so alert-only runs skip the LLM stack."""
+        if self._ai_curator is None:
+            from .ai_curator import AICurator
+
+            self._ai_curator = AICurator()
+        return self._ai_curator
 
     def generate_weekly_newsletter(self, events: List[Event]) -> str:
         """
@@ -44,74 +107,79 @@ class ContentGenerator:
         now = datetime.now()
         date_str = now.strftime("%d %B %Y")
 
-        # Partition events
-        selling_fast = [e for e in events if e.status == EventStatus.SELLING_FAST]
-        just_announced = self._get_just_announced(events)
-        by_category = self._group_by_category(events)
-        free_events = [e for e in events if e.price_min is not None and e.price_min == 0]
-        under_20 = [
-            e
-            for e in events
-            if e.price_min is not None and 0 < e.price_min <= 20
-        ]
-        premium = [
-            e for e in events if e.price_min is not None and e.price_min > 20
-        ]
-
-        # AI curation
-        picks_data = self.ai_curator.curate_editors_picks(events, max_picks=5)
-        picks_map = {p["event_id"]: p["editorial_note"] for p in picks_data}
-        picks_events = [e for e in events if e.id in picks_map]
-
-        highlights = ", ".join(e.title for e in picks_events[:3])
-        intro_text = self.ai_curator.generate_newsletter_intro(
-            len(events), highlights
-        )
+        # Partition events in a single pass
+        cutoff = datetime.utcnow() - timedelta(days=7)
+        selling_fast = []
+        just_announced = []
+        category_pairs = []
+        price_tiers = tuple([] for _ in _PRICE_TIERS)
+
+        for e in events:
+            if e.status == EventStatus.SELLING_FAST:
+                selling_fast.append(e)
+            if e.first_seen_at and e.first_seen_at >= cutoff:
+                just_announced.append(e)
+
+            if e.categories:
+                category_pairs.extend((cat.name, e) for cat in e.categories)
+            else:
+                category_pairs.append(("Other", e))
+
+            p = e.price_min
+            if p is not None and p >= 0:
+                price_tiers[bisect.bisect_left(_PRICE_TIER_BOUNDS, p)].append(e)
 
-        # Build HTML
-        sections = []
+        # Stable sort keeps each category's events in start-date order
+        category_pairs.sort(key=itemgetter(0))
 
-        # --- FREE SECTION (above paywall) ---
-        sections.append(self._render_header(date_str, len(events)))
-        sections.append(self._render_intro(intro_text))
+        self._prime_caches(events)
+        try:
+            # AI curation
+            picks_data = self.ai_curator.curate_editors_picks(events, max_picks=5)
+            picks_map = {p["event_id"]: p["editorial_note"] for p in picks_data}
+            picks_events = [e for e in events if e.id in picks_map]
 
-        if picks_events:
-            sections.append(
-                self._render_editors_picks(picks_events, picks_map)
+            highlights = ", ".join(e.title for e in picks_events[:3])
+            intro_text = self.ai_curator.generate_newsletter_intro(
+                len(events), highlights
             )
 
-        if selling_fast:
-            sections.append(self._render_selling_fast(selling_fast[:10]))
+            # Build HTML into a single buffer
+            buf = io.StringIO()
+            write = buf.write
 
-        # --- PAYWALL MARKER ---
-        sections.append("\n<!-- PAYWALL -->\n")
+            # --- FREE SECTION (above paywall) ---
+            self._render_header(write, date_str, len(events))
+            self._render_intro(write, intro_text)
 
-        # --- PAID SECTION (below paywall) ---
-        if just_announced:
-            sections.append(self._render_just_announced(just_announced[:15]))
+            if picks_events:
+                self._render_editors_picks(write, picks_events, picks_map)
 
-        for category_name, cat_events in sorted(by_category.items()):
-            if cat_events:
-                sections.append(
-                    self._render_category_section(category_name, cat_events)
+            if selling_fast:
+                self._render_section(
+                    write, "Selling Fast", selling_fast[:10], include_urgency=True
                 )
 
-        if free_events:
-            sections.append(
-                self._render_price_section("Free Events", free_events[:15])
-            )
-        if under_20:
-            sections.append(
-                self._render_price_section("Under £20", under_20[:15])
-            )
-        if premium:
-            sections.append(
-                self._render_price_section("Premium Experiences", premium[:15])
-            )
+            # --- PAYWALL MARKER ---
+            write("<!-- PAYWALL -->\n\n")
 
-        sections.append(self._render_footer(date_str))
+            # --- PAID SECTION (below paywall) ---
+            if just_announced:
+                self._render_section(write, "Just Announced", just_announced[:15])
 
-        return "\n\n".join(sections)
+            for category_name, group in groupby(category_pairs, key=itemgetter(0)):
+                cat_events = [e for _, e in islice(group, 20)]
+                self._render_section(write, category_name, cat_events)
+
+            for (heading, _), tier_events in zip(_PRICE_TIERS, price_tiers):
+                if tier_events:
+                    self._render_section(write, heading, tier_events[:15])
+
+            self._render_footer(write, date_str)
+
+            return buf.getvalue()
+        finally:
+            self._clear_caches()
 
     def generate_selling_fast_alert(self, events: List[Event]) -> str:
         """
@@ -123,178 +191,174 @@ class ContentGenerator:
         Returns:
             HTML string for a Substack alert post
         """
-        selling_fast = [e for e in events if e.status == EventStatus.SELLING_FAST]
+        # Only the first eight are shown; stop filtering once they're found
+        selling_fast = list(
+            islice((e for e in events if e.status == EventStatus.SELLING_FAST), 8)
+        )
         if not selling_fast:
             return ""
 
-        now = datetime.now()
-        date_str = now.strftime("%d %B %Y")
+        self._prime_caches(selling_fast)
+        try:
+            now = datetime.now()
+            date_str = now.strftime("%d %B %Y")
 
-        sections = []
-        sections.append(f"<h1>Selling Fast Alert — {date_str}</h1>")
-        sections.append(
-            "<p>These events are running low on tickets. "
-            "If any catch your eye, don't wait.</p>"
-        )
+            buf = io.StringIO()
+            write = buf.write
 
-        for event in selling_fast[:8]:
-            sections.append(self._render_event_card(event, include_urgency=True))
+            write(f"<h1>Selling Fast Alert — {date_str}</h1>\n\n")
+            write(
+                "<p>These events are running low on tickets. "
+                "If any catch your eye, don't wait.</p>\n\n"
+            )
 
-        sections.append(
-            "<hr>\n<p><em>Full listings and editor's picks in the weekly edition.</em></p>"
-        )
+            for event in selling_fast:
+                write(self._render_event_card(event, include_urgency=True))
+                write("\n\n")
+
+            write(
+                "<hr>\n<p><em>Full listings and editor's picks in the weekly edition.</em></p>\n"
+            )
 
-        return "\n\n".join(sections)
+            return buf.getvalue()
+        finally:
+            self._clear_caches()
 
     # --- Rendering helpers ---
 
-    def _render_header(self, date_str: str, total_events: int) -> str:
-        return (
+    def _render_header(self, write, date_str: str, total_events: int):
+        write(
             f"<h1>London Events — Week of {date_str}</h1>\n"
-            f"<p><strong>{total_events} events</strong> across London this week and beyond.</p>"
+            f"<p><strong>{total_events} events</strong> across London this week and beyond.</p>\n\n"
         )
 
-    def _render_intro(self, intro_text: str) -> str:
-        if not intro_text:
-            return ""
-        return f"<p>{intro_text}</p>"
+    def _render_intro(self, write, intro_text: str):
+        if intro_text:
+            write(f"<p>{_esc(intro_text)}</p>\n\n")
 
     def _render_editors_picks(
-        self, events: List[Event], notes: Dict[int, str]
-    ) -> str:
-        lines = ["<h2>Editor's Picks</h2>"]
+        self, write, events: List[Event], notes: Dict[int, str]
+    ):
+        write("<h2>Editor's Picks</h2>\n")
         for event in events:
-            note = notes.get(event.id, "")
-            lines.append(self._render_pick_card(event, note))
-        return "\n".join(lines)
+            write(self._render_pick_card(event, notes.get(event.id, "")))
+            write("\n")
+        write("\n")
 
     def _render_pick_card(self, event: Event, editorial_note: str) -> str:
-        price = self._format_price(event)
-        date = event.start_date.strftime("%A %d %B")
-        venue = event.venue_name or "Venue TBA"
+        price = self._price_for(event)
+        date = _fmt_long(event.start_date)
+        venue = _esc(event.venue_name) or "Venue TBA"
 
-        urgency = self.sellout_detector.get_urgency_message(
-            event.status, event.tickets_available, event.availability_percentage
-        )
+        urgency = self._urgency_for(event)
         urgency_html = f'\n<p><strong>{urgency}</strong></p>' if urgency else ""
 
-        note_html = f"\n<p><em>{editorial_note}</em></p>" if editorial_note else ""
+        note_html = f"\n<p><em>{_esc(editorial_note)}</em></p>" if editorial_note else ""
 
         link = ""
         if event.ticket_url:
-            link = f'\n<p><a href="{event.ticket_url}">Get tickets</a></p>'
+            link = f'\n<p><a href="{_esc(event.ticket_url)}">Get tickets</a></p>'
 
         return (
-            f"<h3>{event.title}</h3>\n"
+            f"<h3>{_esc(event.title)}</h3>\n"
             f"<p>{venue} · {date} · {price}</p>"
             f"{urgency_html}"
             f"{note_html}"
             f"{link}"
         )
 
-    def _render_selling_fast(self, events: List[Event]) -> str:
-        lines = ["<h2>Selling Fast</h2>"]
-        for event in events:
-            lines.append(self._render_event_card(event, include_urgency=True))
-        return "\n".join(lines)
-
-    def _render_just_announced(self, events: List[Event]) -> str:
-        lines = ["<h2>Just Announced</h2>"]
-        for event in events:
-            lines.append(self._render_event_card(event))
-        return "\n".join(lines)
-
-    def _render_category_section(
-        self, category_name: str, events: List[Event]
-    ) -> str:
-        lines = [f"<h2>{category_name}</h2>"]
-        for event in events[:20]:
-            lines.append(self._render_event_card(event))
-        return "\n".join(lines)
-
-    def _render_price_section(self, title: str, events: List[Event]) -> str:
-        lines = [f"<h2>{title}</h2>"]
+    def _render_section(
+        self,
+        write,
+        heading: str,
+        events: List[Event],
+        include_urgency: bool = False,
+    ):
+        write(f"<h2>{_esc(heading)}</h2>\n")
         for event in events:
-            lines.append(self._render_event_card(event))
-        return "\n".join(lines)
+            write(self._render_event_card(event, include_urgency=include_urgency))
+            write("\n")
+        write("\n")
 
     def _render_event_card(
         self, event: Event, include_urgency: bool = False
     ) -> str:
-        price = self._format_price(event)
-        date = event.start_date.strftime("%a %d %b")
-        venue = event.venue_name or "Venue TBA"
+        price = self._price_for(event)
+        date = _fmt_short(event.start_date)
+        venue = _esc(event.venue_name) or "Venue TBA"
 
         urgency_html = ""
         if include_urgency:
-            msg = self.sellout_detector.get_urgency_message(
-                event.status, event.tickets_available, event.availability_percentage
-            )
+            msg = self._urgency_for(event)
             if msg:
                 urgency_html = f" — <strong>{msg}</strong>"
 
         link = ""
         if event.ticket_url:
-            link = f' · <a href="{event.ticket_url}">Tickets</a>'
+            link = f' · <a href="{_esc(event.ticket_url)}">Tickets</a>'
 
         return (
-            f"<p><strong>{event.title}</strong> · {venue} · {date} · {price}"
+            f"<p><strong>{_esc(event.title)}</strong> · {venue} · {date} · {price}"
             f"{urgency_html}{link}</p>"
         )
 
-    def _render_footer(self, date_str: str) -> str:
-        return (
+    def _render_footer(self, write, date_str: str):
+        write(
             "<hr>\n"
             f"<p><em>London Events Report — {date_str}</em></p>\n"
             "<p><em>Data sourced from Ticketmaster, Eventbrite, SeatGeek, "
             "and venue websites. Availability is checked daily but can change rapidly "
-            "— always confirm on the ticket link.</em></p>"
+            "— always confirm on the ticket link.</em></p>\n"
         )
 
     # --- Data helpers ---
 
-    def _get_just_announced(
-        self, events: List[Event], days: int = 7
-    ) -> List[Event]:
-        """Get events first seen in the last N days."""
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        return [
-            e
+    def _prime_caches(self, events: List[Event]):
+        """Format price and urgency once per event for reuse across sections."""
+        # Keyed on the instance: unsaved events all share id None
+        self._price_cache = {id(e): self._format_price(e) for e in events}
+        self._urgency_cache = {
+            id(e): self.sellout_detector.get_urgency_message(
+                e.status, e.tickets_available, e.availability_percentage
+            )
             for e in events
-            if e.first_seen_at and e.first_seen_at >= cutoff
-        ]
-
-    def _group_by_category(
-        self, events: List[Event]
-    ) -> Dict[str, List[Event]]:
-        """Group events by their primary category."""
-        grouped = defaultdict(list)
-        for event in events:
-            if event.categories:
-                for cat in event.categories:
-                    grouped[cat.name].append(event)
-            else:
-                grouped["Other"].append(event)
-        return dict(grouped)
+        }
+
+    def _clear_caches(self):
+        """Drop per-render caches so later calls never see stale strings."""
+        self._price_cache = {}
+        self._urgency_cache = {}
+
+    def _price_for(self, event: Event) -> str:
+        """Cached price string, formatting on a miss."""
+        price = self._price_cache.get(id(event))
+        if price is None:
+            price = self._format_price(event)
+        return price
+
+    def _urgency_for(self, event: Event) -> str:
+        """Cached urgency message, asking the detector on a miss."""
+        urgency = self._urgency_cache.get(id(event))
+        if urgency is None:
+            urgency = self.sellout_detector.get_urgency_message(
+                event.status, event.tickets_available, event.availability_percentage
+            )
+        return urgency
 
     def _format_price(self, event: Event) -> str:
         """Format price for display."""
-        if event.price_min is None and event.price_max is None:
+        # Read each mapped attribute once; instrumented access isn't free
+        price_min = event.price_min
+        price_max = event.price_max
+        if price_min is None and price_max is None:
             return "Price TBA"
-        if event.price_min == 0 and (event.price_max is None or event.price_max == 0):
+        if price_min == 0 and not price_max:
             return "FREE"
 
         symbol = "£" if event.currency == "GBP" else event.currency
 
-        if (
-            event.price_min is not None
-            and event.price_max is not None
-            and event.price_min != event.price_max
-        ):
-            return f"{symbol}{event.price_min:.2f} – {symbol}{event.price_max:.2f}"
-        elif event.price_min is not None:
-            return f"From {symbol}{event.price_min:.2f}"
-        elif event.price_max is not None:
-            return f"Up to {symbol}{event.price_max:.2f}"
-        else:
-            return "Price TBA"
+        if price_min is None:
+            return f"Up to {symbol}{price_max:.2f}"
+        if price_max is not None and price_min != price_max:
+            return f"{symbol}{price_min:.2f} – {symbol}{price_max:.2f}"
+        return f"From {symbol}{price_min:.2f}"
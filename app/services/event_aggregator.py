@@ -1,8 +1,13 @@
 """Event aggregation service - fetches and deduplicates events from all sources."""
 import logging
-from typing import List, Dict
+import unicodedata
+from typing import Iterable, List, Dict, Optional, Tuple, Union
 from datetime import datetime
-from difflib import SequenceMatcher
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from rapidfuzz import fuzz
+from slugify import slugify
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
@@ -14,6 +19,26 @@ from .sellout_detector import SelloutDetector
 
 logger = logging.getLogger(__name__)
 
+# Events saved per commit; also bounds the size of the preload IN lists
+_PROCESS_BATCH_SIZE = 500
+
+
+def _normalize(text: Optional[str]) -> Optional[str]:
+    """Normalise a title or venue for duplicate matching (NFKC, casefolded)."""
+    if not text:
+        return None
+    return unicodedata.normalize("NFKC", text).casefold().strip() or None
+
+
+# Columns _find_duplicate compares; raw text is the fallback for older rows
+_CANDIDATE_COLUMNS = (
+    Event.id,
+    Event.title_normalized,
+    Event.venue_normalized,
+    Event.title,
+    Event.venue_name,
+)
+
 
 class EventAggregator:
     """
@@ -53,79 +78,136 @@ class EventAggregator:
             sources = [s for s in sources if s.name in force_sources]
 
         results = {}
+        if not sources:
+            return results
 
-        for source in sources:
-            logger.info(f"Fetching from {source.display_name}...")
-            try:
-                fetch_start = datetime.now()
-
-                # Fetch events from source
-                events = source.fetch_events(start_date, end_date)
-
-                fetch_duration = (datetime.now() - fetch_start).total_seconds()
+        # One timestamp for the whole run's tracking updates
+        now = datetime.utcnow()
 
-                # Process and save events
-                saved_count = self._process_events(events, source.name)
-
-                # Update data source tracking
-                self._update_source_tracking(
-                    source.name,
-                    source.source_type,
-                    success=True,
-                    events_count=len(events),
-                    fetch_duration=fetch_duration
-                )
-
-                results[source.name] = saved_count
-                logger.info(f"{source.display_name}: Saved {saved_count}/{len(events)} events")
+        # Fetches are I/O-bound and independent; DB writes stay on this thread
+        # and follow source priority order, so dedup is reproducible
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            fetched = executor.map(
+                lambda source: self._fetch_one(source, start_date, end_date), sources
+            )
+            for source, events, fetch_duration, error in fetched:
+                try:
+                    if error is not None:
+                        raise error
+
+                    # Process and save events
+                    saved_count = self._process_events(events, source.name)
+
+                    # Update data source tracking
+                    self._update_source_tracking(
+                        source.name,
+                        source.source_type,
+                        success=True,
+                        events_count=len(events),
+                        fetch_duration=fetch_duration,
+                        now=now,
+                    )
 
-            except Exception as e:
-                logger.error(f"Error fetching from {source.display_name}: {e}")
-                self._update_source_tracking(
-                    source.name,
-                    source.source_type,
-                    success=False,
-                    error=str(e)
-                )
-                results[source.name] = 0
+                    results[source.name] = saved_count
+                    logger.info(f"{source.display_name}: Saved {saved_count}/{len(events)} events")
+
+                except Exception as e:
+                    logger.error(f"Error fetching from {source.display_name}: {e}")
+                    self._update_source_tracking(
+                        source.name,
+                        source.source_type,
+                        success=False,
+                        error=str(e),
+                        now=now,
+                    )
+                    results[source.name] = 0
 
         return results
 
-    def _process_events(self, events: List[EventData], source_name: str) -> int:
+    @staticmethod
+    def _fetch_one(
+        source, start_date: datetime, end_date: datetime
+    ) -> Tuple[object, List[EventData], float, Optional[Exception]]:
+        """
+        Fetch events from a single source (runs on a worker thread).
+
+        Returns:
+            (source, events, fetch duration in seconds, error or None)
+        """
+        logger.info(f"Fetching from {source.display_name}...")
+        fetch_start = datetime.now()
+        try:
+            events = source.fetch_events(start_date, end_date)
+        except Exception as e:
+            return source, [], 0.0, e
+        fetch_duration = (datetime.now() - fetch_start).total_seconds()
+        return source, events, fetch_duration, None
+
+    def _process_events(self, events: Iterable[EventData], source_name: str) -> int:
         """
-        Process and save events to database.
+        Process and save events to database in committed batches.
 
         Args:
-            events: List of EventData objects
+            events: EventData objects (list or iterator)
             source_name: Name of the source
 
         Returns:
             Number of events saved
         """
         saved_count = 0
+        events_iter = iter(events)
+        while batch := list(islice(events_iter, _PROCESS_BATCH_SIZE)):
+            saved_count += self._process_batch(batch, source_name)
+        return saved_count
+
+    def _process_batch(self, events: List[EventData], source_name: str) -> int:
+        """Save one batch of events with a single commit; returns count saved."""
+        saved_count = 0
+        # One timestamp per batch instead of several utcnow() calls per event
+        now = datetime.utcnow()
+        new_events = []
+
+        # Two batched lookups instead of two queries per event
+        existing_by_source_id = {
+            event.source_id: event
+            for event in self.db.query(Event).filter(
+                and_(
+                    Event.source_name == source_name,
+                    Event.source_id.in_({str(e.source_id) for e in events})
+                )
+            )
+        }
+
+        candidates_by_date = defaultdict(list)
+        for row in self.db.query(*_CANDIDATE_COLUMNS, Event.start_date).filter(Event.start_date.in_({e.start_date for e in events})):
+            candidates_by_date[row.start_date].append(self._candidate(row))
 
         for event_data in events:
             try:
                 # Check if event already exists from this source
-                existing = self.db.query(Event).filter(
-                    and_(
-                        Event.source_name == source_name,
-                        Event.source_id == event_data.source_id
-                    )
-                ).first()
+                existing = existing_by_source_id.get(str(event_data.source_id))
 
                 if existing:
                     # Update existing event
-                    self._update_event(existing, event_data)
+                    self._update_event(existing, event_data, now)
                 else:
                     # Check for duplicate from other sources
-                    duplicate = self._find_duplicate(event_data)
+                    duplicate = self._find_duplicate(
+                        event_data, candidates_by_date.get(event_data.start_date, [])
+                    )
                     if duplicate:
                         logger.debug(f"Duplicate event found: {event_data.title}")
                         continue
 
-                    # Create new event
-                    self._create_event(event_data)
+                    # Create new event (inserted in bulk below); register it so
+                    # repeats later in this batch match it like a saved row
+                    event = self._create_event(event_data, now)
+                    new_events.append(event)
+                    existing_by_source_id[str(event_data.source_id)] = event
+                    # Not inserted yet, so no id: the candidate carries the object
+                    candidates_by_date[event_data.start_date].append(
+                        (event, event.title_normalized, event.venue_normalized)
+                    )
 
                 saved_count += 1
 
@@ -133,13 +215,13 @@ class EventAggregator:
                 logger.error(f"Error processing event {event_data.title}: {e}")
                 continue
 
+        if new_events:
+            self.db.bulk_save_objects(new_events)
         self.db.commit()
         return saved_count
 
-    def _create_event(self, event_data: EventData) -> Event:
-        """Create new event in database."""
-        from slugify import slugify
-
+    def _create_event(self, event_data: EventData, now: datetime) -> Event:
+        """Build a new event row; the caller inserts it."""
         # Determine status
         status = self.sellout_detector.determine_status(
             tickets_available=event_data.tickets_available,
@@ -149,11 +231,13 @@ class EventAggregator:
 
         event = Event(
             title=event_data.title,
+            title_normalized=_normalize(event_data.title),
             slug=slugify(event_data.title),
             description=event_data.description,
             start_date=event_data.start_date,
             end_date=event_data.end_date,
             venue_name=event_data.venue_name,
+            venue_normalized=_normalize(event_data.venue_name),
             venue_address=event_data.venue_address,
             latitude=event_data.latitude,
             longitude=event_data.longitude,
@@ -170,7 +254,7 @@ class EventAggregator:
                 event_data.tickets_available,
                 event_data.total_tickets
             ),
-            last_availability_check=datetime.utcnow(),
+            last_availability_check=now,
             source_name=event_data.source_name,
             source_id=event_data.source_id,
             source_url=event_data.source_url,
@@ -179,10 +263,9 @@ class EventAggregator:
             raw_data=event_data.raw_data,
         )
 
-        self.db.add(event)
         return event
 
-    def _update_event(self, event: Event, event_data: EventData):
+    def _update_event(self, event: Event, event_data: EventData, now: datetime):
         """Update existing event with new data."""
         # Update fields that might change
         event.title = event_data.title
@@ -190,6 +273,8 @@ class EventAggregator:
         event.start_date = event_data.start_date
         event.end_date = event_data.end_date
         event.venue_name = event_data.venue_name or event.venue_name
+        event.title_normalized = _normalize(event.title)
+        event.venue_normalized = _normalize(event.venue_name)
         event.venue_address = event_data.venue_address or event.venue_address
         event.ticket_url = event_data.ticket_url or event.ticket_url
         event.price_min = event_data.price_min or event.price_min
@@ -215,18 +300,21 @@ class EventAggregator:
             previous_availability=event.tickets_available,
             last_check=event.last_availability_check,
             event_date=event.start_date,
+            now=now,
         )
 
         # Record history if status changed
         if new_status != event.status:
-            self._record_status_change(event, new_status)
+            self._record_status_change(event, new_status, now)
 
         event.status = new_status
-        event.last_availability_check = datetime.utcnow()
+        event.last_availability_check = now
         event.raw_data = event_data.raw_data
-        event.updated_at = datetime.utcnow()
+        event.updated_at = now
 
-    def _record_status_change(self, event: Event, new_status: EventStatus):
+    def _record_status_change(
+        self, event: Event, new_status: EventStatus, now: datetime
+    ):
         """Record a status transition in availability_history."""
         history = AvailabilityHistory(
             event_id=event.id,
@@ -235,6 +323,7 @@ class EventAggregator:
             tickets_available=event.tickets_available,
             total_tickets=event.total_tickets,
             availability_percentage=event.availability_percentage,
+            recorded_at=now,
         )
         self.db.add(history)
         event.previous_status = event.status
@@ -242,7 +331,11 @@ class EventAggregator:
             f"Status change: '{event.title}' {event.status.value if event.status else 'None'} -> {new_status.value}"
         )
 
-    def _find_duplicate(self, event_data: EventData) -> Event:
+    def _find_duplicate(
+        self,
+        event_data: EventData,
+        candidates: Optional[List[Tuple[Union[int, Event], str, Optional[str]]]] = None,
+    ) -> Optional[Event]:
         """
         Find duplicate events across different sources.
 
@@ -250,39 +343,81 @@ class EventAggregator:
 
         Args:
             event_data: Event to check for duplicates
+            candidates: Preloaded (id, title, venue) rows on the same start
+                date, normalised via _candidate(); queried if not given.
+                Events still pending insert carry the Event in place of the id
 
         Returns:
             Existing event if duplicate found, None otherwise
         """
-        # Query events on the same date
-        same_date_events = self.db.query(Event).filter(
-            Event.start_date == event_data.start_date
-        ).all()
+        # Candidates share the exact start date; fetch only the compared columns
+        if candidates is None:
+            candidates = [
+                self._candidate(row)
+                for row in self.db.query(*_CANDIDATE_COLUMNS).filter(
+                    Event.start_date == event_data.start_date
+                )
+            ]
+
+        # Normalise the incoming side once, not once per candidate
+        title_lc = _normalize(event_data.title)
+        venue_lc = _normalize(event_data.venue_name)
+
+        for existing, existing_title, existing_venue in candidates:
+            # Re-fetched listings usually match exactly; skip scoring entirely
+            if existing_title == title_lc and existing_venue == venue_lc:
+                return self._resolve(existing)
 
-        for existing in same_date_events:
             # Check title similarity
             title_similarity = self._similarity(
-                event_data.title.lower(),
-                existing.title.lower()
+                title_lc, existing_title, threshold=0.85
             )
+            if title_similarity <= 0.85:
+                continue
 
             # Check venue similarity if both have venues
             venue_similarity = 1.0
-            if event_data.venue_name and existing.venue_name:
+            if venue_lc and existing_venue:
                 venue_similarity = self._similarity(
-                    event_data.venue_name.lower(),
-                    existing.venue_name.lower()
+                    venue_lc, existing_venue, threshold=0.75
                 )
 
             # Consider it a duplicate if both title and venue are very similar
-            if title_similarity > 0.85 and venue_similarity > 0.75:
-                return existing
+            if venue_similarity > 0.75:
+                return self._resolve(existing)
 
         return None
 
-    def _similarity(self, a: str, b: str) -> float:
-        """Calculate similarity ratio between two strings."""
-        return SequenceMatcher(None, a, b).ratio()
+    def _resolve(self, existing: Union[int, Event]) -> Optional[Event]:
+        """Return the candidate's Event, loading saved rows by id."""
+        if isinstance(existing, Event):
+            return existing
+        return self.db.get(Event, existing)
+
+    @staticmethod
+    def _candidate(row) -> Tuple[int, str, Optional[str]]:
+        """Reduce a _CANDIDATE_COLUMNS row to (id, title, venue) in normalised form."""
+        # Rows saved before the normalised columns existed fall back to the raw text
+        return (
+            row.id,
+            row.title_normalized or _normalize(row.title),
+            row.venue_normalized or _normalize(row.venue_name),
+        )
+
+    def _similarity(self, a: str, b: str, threshold: float = 0.0) -> float:
+        """
+        Calculate similarity ratio between two strings.
+
+        Uses rapidfuzz's C++ Indel ratio, 2 * LCS / (len(a) + len(b)). This
+        is never lower than difflib's SequenceMatcher.ratio(), whose greedy
+        block matching can miss the longest common subsequence; the two
+        agree on near-duplicate titles but rapidfuzz scores unrelated strings
+        higher (e.g. 0.46 vs 0.41). Scores below ``threshold`` are cut off
+        early and returned as 0.0.
+        """
+        if a is b or a == b:
+            return 1.0
+        return fuzz.ratio(a, b, score_cutoff=threshold * 100) / 100
 
     def _calculate_availability_percentage(
         self,
@@ -303,7 +438,8 @@ class EventAggregator:
         success: bool,
         events_count: int = 0,
         fetch_duration: float = 0,
-        error: str = None
+        error: str = None,
+        now: Optional[datetime] = None,
     ):
         """Update data source tracking."""
         source = self.db.query(DataSource).filter(
@@ -318,18 +454,20 @@ class EventAggregator:
             )
             self.db.add(source)
 
-        source.last_fetch_attempt = datetime.utcnow()
+        now = now or datetime.utcnow()
+        source.last_fetch_attempt = now
 
         if success:
-            source.last_successful_fetch = datetime.utcnow()
+            source.last_successful_fetch = now
             source.events_fetched_count = (source.events_fetched_count or 0) + events_count
             source.last_error = None
 
-            # Update average fetch time
-            if source.average_fetch_time:
-                source.average_fetch_time = (source.average_fetch_time + fetch_duration) / 2
-            else:
-                source.average_fetch_time = fetch_duration
+            # Running totals give a true mean over every successful fetch
+            source.total_fetch_time = (source.total_fetch_time or 0.0) + fetch_duration
+            source.successful_fetch_count = (source.successful_fetch_count or 0) + 1
+            source.average_fetch_time = (
+                source.total_fetch_time / source.successful_fetch_count
+            )
         else:
             source.last_error = error
 
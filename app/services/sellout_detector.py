@@ -1,5 +1,6 @@
 """Sellout detection service - identifies events that are selling out."""
 import logging
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime, timedelta
 from ..models.database import EventStatus
@@ -7,6 +8,53 @@ from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Source on-sale status strings, normalised to lowercase before lookup
+_SALE_STATES = {
+    "soldout": EventStatus.SOLD_OUT,
+    "sold_out": EventStatus.SOLD_OUT,
+    "sold-out": EventStatus.SOLD_OUT,
+    "cancelled": EventStatus.CANCELLED,
+    "canceled": EventStatus.CANCELLED,
+    "onsale": EventStatus.ON_SALE,
+    "on_sale": EventStatus.ON_SALE,
+    "presale": EventStatus.ON_SALE,
+    "pre_sale": EventStatus.ON_SALE,
+    "offsale": EventStatus.UPCOMING,
+    "off_sale": EventStatus.UPCOMING,
+}
+# Source states that override availability data
+_FINAL_STATES = frozenset({EventStatus.SOLD_OUT, EventStatus.CANCELLED})
+
+
+@lru_cache(maxsize=4096)
+def _urgency_message(
+    status: EventStatus,
+    tickets_available: Optional[int],
+    availability_percentage: Optional[float],
+) -> str:
+    """Urgency message for a status/availability triple; see get_urgency_message."""
+    if status == EventStatus.SOLD_OUT:
+        return "SOLD OUT"
+
+    elif status == EventStatus.SELLING_FAST:
+        if tickets_available and tickets_available <= 10:
+            return f"Only {tickets_available} tickets left!"
+        elif availability_percentage and availability_percentage <= 5:
+            return "Less than 5% of tickets remaining!"
+        elif availability_percentage and availability_percentage <= 10:
+            return "Selling fast - less than 10% remaining!"
+        else:
+            return "Selling fast - book soon!"
+
+    elif status == EventStatus.ON_SALE:
+        return "On sale now"
+
+    elif status == EventStatus.CANCELLED:
+        return "Cancelled"
+
+    else:
+        return ""
+
 
 class SelloutDetector:
     """
@@ -31,6 +79,7 @@ class SelloutDetector:
         previous_availability: Optional[int] = None,
         last_check: Optional[datetime] = None,
         event_date: Optional[datetime] = None,
+        now: Optional[datetime] = None,
     ) -> EventStatus:
         """
         Determine event status based on ticket availability.
@@ -42,19 +91,20 @@ class SelloutDetector:
             previous_availability: Previous ticket count
             last_check: When availability was last checked
             event_date: Date of the event
+            now: Reference time for the rate check; defaults to utcnow()
 
         Returns:
             EventStatus enum value
         """
+        sale_status = _SALE_STATES.get(on_sale_status.lower()) if on_sale_status else None
+
         # Check if sold out
-        if tickets_available == 0 or (
-            on_sale_status and on_sale_status in ["soldout", "sold_out", "sold-out"]
-        ):
+        if tickets_available == 0:
             return EventStatus.SOLD_OUT
 
-        # Check if cancelled
-        if on_sale_status and on_sale_status in ["cancelled", "canceled"]:
-            return EventStatus.CANCELLED
+        # Sold out or cancelled at source
+        if sale_status in _FINAL_STATES:
+            return sale_status
 
         # If we have availability data, calculate percentage
         if tickets_available is not None and total_tickets is not None and total_tickets > 0:
@@ -74,27 +124,19 @@ class SelloutDetector:
             last_check is not None and
             event_date is not None):
 
+            now = now or datetime.utcnow()
             is_selling_fast = self._is_selling_fast_by_rate(
                 current_available=tickets_available,
                 previous_available=previous_availability,
-                time_since_check=datetime.utcnow() - last_check,
-                time_until_event=event_date - datetime.utcnow()
+                time_since_check=now - last_check,
+                time_until_event=event_date - now
             )
 
             if is_selling_fast:
                 return EventStatus.SELLING_FAST
 
-        # Check on-sale status
-        if on_sale_status:
-            if on_sale_status in ["onsale", "on_sale"]:
-                return EventStatus.ON_SALE
-            elif on_sale_status in ["presale", "pre_sale"]:
-                return EventStatus.ON_SALE
-            elif on_sale_status in ["offsale", "off_sale"]:
-                return EventStatus.UPCOMING
-
-        # Default status
-        return EventStatus.UPCOMING
+        # Fall back to on-sale status, defaulting to upcoming
+        return sale_status or EventStatus.UPCOMING
 
     def _is_selling_fast_by_rate(
         self,
@@ -216,27 +258,7 @@ class SelloutDetector:
         Returns:
             Urgency message string
         """
-        if status == EventStatus.SOLD_OUT:
-            return "SOLD OUT"
-
-        elif status == EventStatus.SELLING_FAST:
-            if tickets_available and tickets_available <= 10:
-                return f"Only {tickets_available} tickets left!"
-            elif availability_percentage and availability_percentage <= 5:
-                return "Less than 5% of tickets remaining!"
-            elif availability_percentage and availability_percentage <= 10:
-                return "Selling fast - less than 10% remaining!"
-            else:
-                return "Selling fast - book soon!"
-
-        elif status == EventStatus.ON_SALE:
-            return "On sale now"
-
-        elif status == EventStatus.CANCELLED:
-            return "Cancelled"
-
-        else:
-            return ""
+        return _urgency_message(status, tickets_available, availability_percentage)
 
     def should_highlight(self, status: EventStatus) -> bool:
         """
@@ -248,4 +270,4 @@ class SelloutDetector:
         Returns:
             True if should be highlighted
         """
-        return status in [EventStatus.SELLING_FAST, EventStatus.ON_SALE]
+        return status in (EventStatus.SELLING_FAST, EventStatus.ON_SALE)
@@ -6,11 +6,10 @@ from pathlib import Path
 from typing import List, Optional
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 
 from ..models.database import Event, EventStatus, AvailabilityHistory
 from ..config import settings
-from .content_generator import ContentGenerator
 
 logger = logging.getLogger(__name__)
 
@@ -45,53 +44,62 @@ class SelloutMonitor:
         """
         now = datetime.utcnow()
 
-        # Get status transitions since the given time
-        history_records = (
-            db.query(AvailabilityHistory)
+        # Latest transition per event since the given time, resolved in SQL
+        latest = (
+            db.query(
+                AvailabilityHistory.event_id,
+                func.max(AvailabilityHistory.recorded_at).label("recorded_at"),
+            )
             .filter(AvailabilityHistory.recorded_at >= since)
-            .order_by(AvailabilityHistory.recorded_at.desc())
+            .group_by(AvailabilityHistory.event_id)
+            .subquery()
+        )
+        latest_status = dict(
+            db.query(AvailabilityHistory.event_id, AvailabilityHistory.new_status)
+            .join(
+                latest,
+                and_(
+                    AvailabilityHistory.event_id == latest.c.event_id,
+                    AvailabilityHistory.recorded_at == latest.c.recorded_at,
+                ),
+            )
+            .filter(
+                AvailabilityHistory.new_status.in_(
+                    [EventStatus.SELLING_FAST, EventStatus.SOLD_OUT]
+                )
+            )
             .all()
         )
-
-        # Track the latest transition per event (deduplicate multiple changes)
-        seen_event_ids = set()
-        selling_fast_ids = set()
-        sold_out_ids = set()
-
-        for record in history_records:
-            if record.event_id in seen_event_ids:
-                continue
-            seen_event_ids.add(record.event_id)
-
-            if record.new_status == EventStatus.SELLING_FAST:
-                selling_fast_ids.add(record.event_id)
-            elif record.new_status == EventStatus.SOLD_OUT:
-                sold_out_ids.add(record.event_id)
+        alert_ids = list(latest_status)
 
         result = AlertResult()
 
-        # Load events, filtering to future events only
-        if selling_fast_ids:
-            result.newly_selling_fast = (
+        # Load both groups in one query, filtering to future events only
+        events = []
+        if alert_ids:
+            events = (
                 db.query(Event)
                 .filter(
-                    Event.id.in_(selling_fast_ids),
+                    Event.id.in_(alert_ids),
                     Event.start_date >= now,
                 )
-                .order_by(Event.availability_percentage.asc())
                 .all()
             )
 
-        if sold_out_ids:
-            result.newly_sold_out = (
-                db.query(Event)
-                .filter(
-                    Event.id.in_(sold_out_ids),
-                    Event.start_date >= now,
-                )
-                .order_by(Event.start_date.asc())
-                .all()
+        for event in events:
+            if latest_status[event.id] == EventStatus.SELLING_FAST:
+                result.newly_selling_fast.append(event)
+            else:
+                result.newly_sold_out.append(event)
+
+        # Unknown availability sorts last, as it does in PostgreSQL
+        result.newly_selling_fast.sort(
+            key=lambda e: (
+                e.availability_percentage is None,
+                e.availability_percentage or 0.0,
             )
+        )
+        result.newly_sold_out.sort(key=lambda e: e.start_date)
 
         logger.info(
             f"Alert check: {len(result.newly_selling_fast)} selling fast, "
@@ -127,7 +135,8 @@ class SelloutMonitor:
         Returns:
             Path to generated alert file, or None if no alert needed
         """
-        since = datetime.utcnow() - timedelta(hours=25)
+        now = datetime.utcnow()
+        since = now - timedelta(hours=25)
         result = self.check_for_alerts(db, since=since)
 
         if not self.should_generate_alert(result):
@@ -137,6 +146,8 @@ class SelloutMonitor:
         # Combine events for the alert: selling-fast + recently sold-out
         all_alert_events = result.newly_selling_fast + result.newly_sold_out
 
+        from .content_generator import ContentGenerator
+
         generator = ContentGenerator()
         html = generator.generate_selling_fast_alert(all_alert_events)
 
@@ -147,9 +158,10 @@ class SelloutMonitor:
         output_dir = Path(settings.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Named by the local calendar date; "now" above is UTC for the DB query
         date_str = datetime.now().strftime("%Y-%m-%d")
         output_path = output_dir / f"alert_{date_str}.html"
-        output_path.write_text(html, encoding="utf-8")
+        output_path.write_bytes(html.encode("utf-8"))
 
         logger.info(
             f"Alert generated: {output_path} "
@@ -9,9 +9,11 @@ from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy.orm import load_only, raiseload
+
 from app.database import SessionLocal, init_db
 from app.models.database import Event, EventStatus
-from app.services.content_generator import ContentGenerator
+from app.services.content_generator import CONTENT_COLUMNS, ContentGenerator
 from app.services.sellout_monitor import SelloutMonitor
 from app.config import settings
 
@@ -30,6 +32,12 @@ def main():
         action="store_true",
         help="Scheduler mode: quiet output, exit 0 = alert generated, exit 1 = no alert",
     )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=100,
+        help="Manual mode: load at most this many events per group (default: 100)",
+    )
     args = parser.parse_args()
 
     logger.info("Initializing database...")
@@ -54,17 +62,20 @@ def main():
 
             selling_fast = (
                 db.query(Event)
+                .options(load_only(*CONTENT_COLUMNS), raiseload("*"))
                 .filter(
                     Event.start_date >= now,
                     Event.start_date <= end_date,
                     Event.status == EventStatus.SELLING_FAST,
                 )
                 .order_by(Event.availability_percentage.asc())
+                .limit(args.limit)
                 .all()
             )
 
             sold_out = (
                 db.query(Event)
+                .options(load_only(*CONTENT_COLUMNS), raiseload("*"))
                 .filter(
                     Event.start_date >= now,
                     Event.start_date <= end_date,
@@ -72,6 +83,7 @@ def main():
                     Event.previous_status != None,  # Only recently changed
                 )
                 .order_by(Event.start_date.asc())
+                .limit(args.limit)
                 .all()
             )
 
@@ -97,7 +109,7 @@ def main():
 
             date_str = datetime.now().strftime("%Y-%m-%d")
             output_path = output_dir / f"alert_{date_str}.html"
-            output_path.write_text(html, encoding="utf-8")
+            output_path.write_bytes(html.encode("utf-8"))
 
             print(f"Selling-fast alert generated: {output_path}")
             print(f"  Selling fast: {len(selling_fast)}")
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 """CLI entry point: generate weekly newsletter HTML for Substack."""
+import argparse
 import sys
 import os
 import logging
@@ -9,9 +10,11 @@ from pathlib import Path
 # Ensure project root is on path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy.orm import load_only, raiseload, selectinload
+
 from app.database import SessionLocal, init_db
 from app.models.database import Event, EventStatus
-from app.services.content_generator import ContentGenerator
+from app.services.content_generator import CONTENT_COLUMNS, ContentGenerator
 from app.config import settings
 
 logging.basicConfig(
@@ -23,6 +26,15 @@ logger = logging.getLogger(__name__)
 
 def main():
     """Generate the weekly newsletter."""
+    parser = argparse.ArgumentParser(description="Generate weekly newsletter")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=500,
+        help="Load at most this many upcoming events, earliest first (default: 500)",
+    )
+    args = parser.parse_args()
+
     logger.info("Initializing database...")
     init_db()
 
@@ -34,8 +46,15 @@ def main():
 
         events = (
             db.query(Event)
+            .options(
+                load_only(*CONTENT_COLUMNS),
+                # Categories in one batched query; any other lazy load is a bug
+                selectinload(Event.categories),
+                raiseload("*"),
+            )
             .filter(Event.start_date >= now, Event.start_date <= end_date)
             .order_by(Event.start_date.asc())
+            .limit(args.limit)
             .all()
         )
 
@@ -57,7 +76,7 @@ def main():
 
         date_str = datetime.now().strftime("%Y-%m-%d")
         output_path = output_dir / f"newsletter_{date_str}.html"
-        output_path.write_text(html, encoding="utf-8")
+        output_path.write_bytes(html.encode("utf-8"))
 
         print(f"Newsletter generated: {output_path}")
         print(f"  Events included: {len(events)}")
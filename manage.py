@@ -6,8 +6,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from datetime import datetime, timedelta
-from app.database import SessionLocal, init_db
-from app.services.event_aggregator import EventAggregator
+from app.database import SessionLocal, engine, init_db
 
 
 def cli():
@@ -20,6 +19,11 @@ def cli():
     # initdb
     sub.add_parser("initdb", help="Initialize database schema")
 
+    # upgradedb
+    sub.add_parser(
+        "upgradedb", help="Add columns and indexes missing from an existing database"
+    )
+
     # fetch
     fetch_p = sub.add_parser("fetch", help="Fetch events from data sources")
     fetch_p.add_argument("--days", type=int, default=90, help="Days ahead to fetch")
@@ -35,6 +39,8 @@ def cli():
 
     if args.command == "initdb":
         cmd_initdb()
+    elif args.command == "upgradedb":
+        cmd_upgradedb()
     elif args.command == "fetch":
         cmd_fetch(args.days, args.sources)
     elif args.command == "sources":
@@ -52,8 +58,115 @@ def cmd_initdb():
     print("Database initialized successfully.")
 
 
+def cmd_upgradedb():
+    """Bring an existing database up to the current models."""
+    print("Upgrading database schema...")
+    added = upgrade_schema(engine)
+    for name in added:
+        print(f"  added column {name}")
+    print("Database upgraded successfully.")
+
+
+# (table, index) pairs dropped by upgrade_schema where an earlier model created them
+_DROPPED_INDEXES = (
+    # Only ever written to; nothing filters or sorts on popularity_score in SQL
+    ("events", "ix_events_popularity_score"),
+)
+
+
+def upgrade_schema(bind) -> list:
+    """
+    Add missing columns and indexes, then backfill derived columns.
+
+    create_all() only creates missing tables, so columns added to an
+    existing model never reach a deployed database without this. Safe to
+    re-run: anything already present is left alone.
+
+    Args:
+        bind: Engine to upgrade
+
+    Returns:
+        Names of the columns added, as "table.column"
+    """
+    from sqlalchemy import bindparam, inspect, select
+    from app.models.database import Base, DataSource, Event
+    from app.services.event_aggregator import _normalize
+
+    added = []
+    with bind.begin() as conn:
+        existing = set(inspect(conn).get_table_names())
+        quote = conn.dialect.identifier_preparer.quote
+
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing:
+                continue
+            present = {c["name"] for c in inspect(conn).get_columns(table.name)}
+            for column in table.columns:
+                if column.name in present:
+                    continue
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {quote(table.name)} ADD COLUMN {quote(column.name)} "
+                    f"{column.type.compile(dialect=conn.dialect)}"
+                )
+                added.append(f"{table.name}.{column.name}")
+
+        # New tables, then indexes on tables that already existed
+        Base.metadata.create_all(conn)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+        # Indexes since removed from the models
+        for table_name, index_name in _DROPPED_INDEXES:
+            if table_name not in existing:
+                continue
+            if index_name in {i["name"] for i in inspect(conn).get_indexes(table_name)}:
+                conn.exec_driver_sql(f"DROP INDEX {quote(index_name)}")
+
+        # Rows saved before the normalised dedup columns existed
+        events = Event.__table__
+        rows = conn.execute(
+            select(events.c.id, events.c.title, events.c.venue_name).where(
+                events.c.title_normalized.is_(None)
+            )
+        ).all()
+        if rows:
+            conn.execute(
+                events.update()
+                .where(events.c.id == bindparam("row_id"))
+                .values(
+                    title_normalized=bindparam("title_norm"),
+                    venue_normalized=bindparam("venue_norm"),
+                ),
+                [
+                    {
+                        "row_id": row.id,
+                        "title_norm": _normalize(row.title),
+                        "venue_norm": _normalize(row.venue_name),
+                    }
+                    for row in rows
+                ],
+            )
+
+        # Seed fetch-time totals from the old running average. The number of
+        # fetches behind it was never stored, so it carries one sample's weight
+        sources = DataSource.__table__
+        conn.execute(
+            sources.update()
+            .where(
+                sources.c.successful_fetch_count.is_(None),
+                sources.c.average_fetch_time.is_not(None),
+            )
+            .values(total_fetch_time=sources.c.average_fetch_time, successful_fetch_count=1)
+        )
+
+    return added
+
+
 def cmd_fetch(days: int, sources: str = None):
     """Fetch events from data sources."""
+    from app.services.event_aggregator import EventAggregator
+
     db = SessionLocal()
     try:
         start_date = datetime.now()
@@ -69,12 +182,10 @@ def cmd_fetch(days: int, sources: str = None):
             start_date, end_date, force_sources=source_list
         )
 
-        print("\nResults:")
-        for source, count in results.items():
-            print(f"  {source}: {count} events")
-
-        total = sum(results.values())
-        print(f"\nTotal: {total} events fetched")
+        out = ["\nResults:\n"]
+        out.extend(f"  {source}: {count} events\n" for source, count in results.items())
+        out.append(f"\nTotal: {sum(results.values())} events fetched\n")
+        sys.stdout.write("".join(out))
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -96,32 +207,35 @@ def cmd_sources():
 
 def cmd_stats():
     """Show application statistics."""
-    from app.models.database import Event, DataSource, Category
-
-    db = SessionLocal()
-    try:
-        event_count = db.query(Event).count()
-        source_count = db.query(DataSource).count()
-        category_count = db.query(Category).count()
-
-        upcoming_events = db.query(Event).filter(
-            Event.start_date >= datetime.now()
-        ).count()
-
-        selling_fast = db.query(Event).filter(
-            Event.status == "selling_fast",
-            Event.start_date >= datetime.now(),
-        ).count()
-
-        print("Application Statistics\n")
-        print(f"Events (total):    {event_count}")
-        print(f"Events (upcoming): {upcoming_events}")
-        print(f"Selling fast:      {selling_fast}")
-        print(f"Data sources:      {source_count}")
-        print(f"Categories:        {category_count}")
-
-    finally:
-        db.close()
+    from sqlalchemy import func, select
+    from app.models.database import Event, EventStatus, DataSource, Category
+
+    now = datetime.now()
+    upcoming = Event.start_date >= now
+
+    # All counts in one round-trip: filtered aggregates + scalar subqueries
+    stmt = select(
+        func.count(Event.id).label("events"),
+        func.count(Event.id).filter(upcoming).label("upcoming"),
+        func.count(Event.id).filter(
+            upcoming, Event.status == EventStatus.SELLING_FAST
+        ).label("selling_fast"),
+        select(func.count(DataSource.id)).scalar_subquery().label("sources"),
+        select(func.count(Category.id)).scalar_subquery().label("categories"),
+    )
+
+    # Read-only counts need no ORM Session; run on a plain Connection
+    with engine.connect() as conn:
+        row = conn.execute(stmt).one()
+
+    sys.stdout.write(
+        "Application Statistics\n\n"
+        f"Events (total):    {row.events}\n"
+        f"Events (upcoming): {row.upcoming}\n"
+        f"Selling fast:      {row.selling_fast}\n"
+        f"Data sources:      {row.sources}\n"
+        f"Categories:        {row.categories}\n"
+    )
 
 
 if __name__ == "__main__":
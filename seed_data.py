@@ -1,27 +1,30 @@
 #!/usr/bin/env python
 """Seed database with initial data."""
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
 from app.database import SessionLocal, init_db
 from app.models.database import Category
-from slugify import slugify
 
 
+# (name, slug, description, icon)
 CATEGORIES = [
-    ("Music", "Live music, concerts, gigs, and performances", "🎵"),
-    ("Theatre", "Plays, musicals, and theatrical performances", "🎭"),
-    ("Comedy", "Stand-up comedy, improv, and comedy shows", "😂"),
-    ("Sports", "Sporting events and competitions", "⚽"),
-    ("Arts", "Art exhibitions, galleries, and visual arts", "🎨"),
-    ("Film", "Cinema screenings and film festivals", "🎬"),
-    ("Food", "Food festivals, tastings, and culinary events", "🍽️"),
-    ("Family", "Family-friendly events and activities", "👨‍👩‍👧‍👦"),
-    ("Festival", "Festivals and large-scale celebrations", "🎪"),
-    ("Nightlife", "Clubs, parties, and nightlife events", "🌃"),
-    ("Business", "Networking, conferences, and professional events", "💼"),
-    ("Tech", "Technology conferences and meetups", "💻"),
-    ("Wellness", "Health, fitness, and wellness events", "🧘"),
-    ("Education", "Workshops, classes, and learning events", "📚"),
-    ("Community", "Community events and gatherings", "🤝"),
-    ("Other", "Other events and activities", "📍"),
+    ("Music", "music", "Live music, concerts, gigs, and performances", "🎵"),
+    ("Theatre", "theatre", "Plays, musicals, and theatrical performances", "🎭"),
+    ("Comedy", "comedy", "Stand-up comedy, improv, and comedy shows", "😂"),
+    ("Sports", "sports", "Sporting events and competitions", "⚽"),
+    ("Arts", "arts", "Art exhibitions, galleries, and visual arts", "🎨"),
+    ("Film", "film", "Cinema screenings and film festivals", "🎬"),
+    ("Food", "food", "Food festivals, tastings, and culinary events", "🍽️"),
+    ("Family", "family", "Family-friendly events and activities", "👨‍👩‍👧‍👦"),
+    ("Festival", "festival", "Festivals and large-scale celebrations", "🎪"),
+    ("Nightlife", "nightlife", "Clubs, parties, and nightlife events", "🌃"),
+    ("Business", "business", "Networking, conferences, and professional events", "💼"),
+    ("Tech", "tech", "Technology conferences and meetups", "💻"),
+    ("Wellness", "wellness", "Health, fitness, and wellness events", "🧘"),
+    ("Education", "education", "Workshops, classes, and learning events", "📚"),
+    ("Community", "community", "Community events and gatherings", "🤝"),
+    ("Other", "other", "Other events and activities", "📍"),
 ]
 
 
@@ -33,21 +36,24 @@ def seed_categories():
         init_db()
 
         print("Seeding categories...")
-        for name, description, icon in CATEGORIES:
-            # Check if exists
-            existing = db.query(Category).filter(Category.name == name).first()
-            if existing:
+        rows = [
+            {"name": name, "slug": slug, "description": description, "icon": icon}
+            for name, slug, description, icon in CATEGORIES
+        ]
+        insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = (
+            insert(Category)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(Category.name)
+        )
+        inserted = set(db.execute(stmt).scalars())
+
+        for name, *_ in CATEGORIES:
+            if name in inserted:
+                print(f"  + {name}")
+            else:
                 print(f"  ✓ {name} (already exists)")
-                continue
-
-            category = Category(
-                name=name,
-                slug=slugify(name),
-                description=description,
-                icon=icon
-            )
-            db.add(category)
-            print(f"  + {name}")
 
         db.commit()
         print("\n✓ Database seeded successfully!")
@@ -1,4 +1,5 @@
 """Shared test fixtures."""
+import itertools
 import os
 
 # Set env vars BEFORE any app imports so Settings() doesn't fail
@@ -6,30 +7,61 @@ os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 
 import pytest
 from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from app.models.database import Base, Event, Category, EventStatus
 
+# Default start date for make_event; datetimes are immutable so one is shared
+DEFAULT_START = datetime(2026, 3, 15, 19, 30)
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """In-memory SQLite engine with the schema created once per test run."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; emit BEGIN ourselves
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
-@pytest.fixture
-def db_session():
-    """In-memory SQLite session. Creates tables, yields session, cleans up."""
-    engine = create_engine("sqlite:///:memory:")
     Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """Session inside an outer transaction that is rolled back after each test.
+
+    Commits made by the code under test only release a SAVEPOINT, so every
+    test starts from empty tables without re-running DDL.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
-        Base.metadata.drop_all(engine)
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture
 def make_event():
     """Factory for Event ORM objects with sensible defaults."""
-    _counter = 0
+    ids = itertools.count(1)
 
     def _make(
         title="Test Event",
@@ -51,17 +83,16 @@ def make_event():
         first_seen_at=None,
         **kwargs,
     ):
-        nonlocal _counter
-        _counter += 1
+        event_id = next(ids)
         if start_date is None:
-            start_date = datetime(2026, 3, 15, 19, 30)
+            start_date = DEFAULT_START
         if source_id is None:
-            source_id = f"test-{_counter}"
+            source_id = f"test-{event_id}"
         if slug is None:
-            slug = f"test-event-{_counter}"
+            slug = f"test-event-{event_id}"
 
         return Event(
-            id=_counter,
+            id=event_id,
             title=title,
             start_date=start_date,
             venue_name=venue_name,
@@ -88,13 +119,11 @@ def make_event():
 @pytest.fixture
 def make_category():
     """Factory for Category ORM objects."""
-    _counter = 0
+    ids = itertools.count(1)
 
     def _make(name="Music", slug=None):
-        nonlocal _counter
-        _counter += 1
         if slug is None:
             slug = name.lower().replace(" ", "-")
-        return Category(id=_counter, name=name, slug=slug)
+        return Category(id=next(ids), name=name, slug=slug)
 
     return _make
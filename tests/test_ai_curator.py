@@ -1,6 +1,6 @@
 """Tests for AICurator — fallback logic + mocked Anthropic API."""
 import pytest
-import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from datetime import datetime
 
@@ -62,6 +62,11 @@ class TestFallbackPicks:
         picks = curator._fallback_picks(events, 3)
         assert len(picks) == 3
 
+    def test_ties_keep_input_order(self, curator, make_event):
+        events = [make_event(popularity_score=5.0) for _ in range(4)]
+        picks = curator._fallback_picks(events, 2)
+        assert [p["event_id"] for p in picks] == [events[0].id, events[1].id]
+
     def test_return_format(self, curator, make_event):
         e = make_event()
         picks = curator._fallback_picks([e], 5)
@@ -88,38 +93,71 @@ class TestFallbackNewsletterIntro:
 # --- _format_events_for_prompt ---
 
 class TestFormatEventsForPrompt:
+    def _row(self, curator, event):
+        header, row = curator._format_events_for_prompt([event]).split("\n")
+        return dict(zip(header.split("\t"), row.split("\t")))
+
     def test_basic_event(self, curator, make_event):
         e = make_event(title="Jazz Night", venue_name="Ronnie Scotts")
-        text = curator._format_events_for_prompt([e])
-        assert "ID:" in text
-        assert "Jazz Night" in text
-        assert "Ronnie Scotts" in text
+        row = self._row(curator, e)
+        assert row["id"] == str(e.id)
+        assert row["title"] == "Jazz Night"
+        assert row["venue"] == "Ronnie Scotts"
+        assert row["date"] == "15 Mar"
 
-    def test_selling_fast_tag(self, curator, make_event):
+    def test_selling_fast_flag(self, curator, make_event):
         e = make_event(status=EventStatus.SELLING_FAST)
-        text = curator._format_events_for_prompt([e])
-        assert "[SELLING FAST]" in text
+        assert self._row(curator, e)["status"] == "F"
 
-    def test_sold_out_tag(self, curator, make_event):
+    def test_sold_out_flag(self, curator, make_event):
         e = make_event(status=EventStatus.SOLD_OUT)
-        text = curator._format_events_for_prompt([e])
-        assert "[SOLD OUT]" in text
+        assert self._row(curator, e)["status"] == "S"
 
-    def test_venue_none_shows_tba(self, curator, make_event):
+    def test_upcoming_has_blank_status(self, curator, make_event):
+        assert self._row(curator, make_event())["status"] == ""
+
+    def test_venue_none_blank(self, curator, make_event):
         e = make_event(venue_name=None)
-        text = curator._format_events_for_prompt([e])
-        assert "Venue TBA" in text
+        assert self._row(curator, e)["venue"] == ""
 
     def test_price_range(self, curator, make_event):
         e = make_event(price_min=25, price_max=50)
-        text = curator._format_events_for_prompt([e])
-        assert "£25" in text
-        assert "£50" in text
+        row = self._row(curator, e)
+        assert row["pmin"] == "25"
+        assert row["pmax"] == "50"
+
+    def test_category_codes(self, curator, make_event, make_category):
+        e = make_event()
+        e.categories = [make_category("Music"), make_category("Comedy")]
+        assert self._row(curator, e)["cats"] == "MU,CO"
+
+    def test_tabs_in_title_replaced(self, curator, make_event):
+        e = make_event(title="Odd\tTitle")
+        assert self._row(curator, e)["title"] == "Odd Title"
 
 
 # --- curate_editors_picks with API ---
 
+class _StubMessages:
+    """Stands in for client.messages; records create() kwargs."""
+
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.response
+
+
 class TestCurateEditorsPicksAPI:
+    def _client_returning(self, *blocks):
+        response = SimpleNamespace(content=list(blocks))
+        return SimpleNamespace(messages=_StubMessages(response))
+
+    def _tool_use(self, picks):
+        return SimpleNamespace(type="tool_use", input={"picks": picks})
+
     def test_no_api_key_returns_fallback(self, curator, make_event):
         events = [make_event(title=f"E{i}") for i in range(5)]
         picks = curator.curate_editors_picks(events, max_picks=3)
@@ -130,15 +168,10 @@ class TestCurateEditorsPicksAPI:
         e2 = make_event(title="Event Two")
         events = [e1, e2]
 
-        response_json = json.dumps([
+        mock_client = self._client_returning(self._tool_use([
             {"event_id": e1.id, "editorial_note": "Great show"},
             {"event_id": e2.id, "editorial_note": "Must see"},
-        ])
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(text=response_json)]
-
-        mock_client = MagicMock()
-        mock_client.messages.create.return_value = mock_response
+        ]))
 
         with patch.object(curator_with_key, "_get_client", return_value=mock_client):
             picks = curator_with_key.curate_editors_picks(events, max_picks=5)
@@ -147,16 +180,24 @@ class TestCurateEditorsPicksAPI:
         assert picks[0]["event_id"] == e1.id
         assert picks[0]["editorial_note"] == "Great show"
 
-    def test_markdown_json_response(self, curator_with_key, make_event):
-        """API returns JSON wrapped in markdown code blocks."""
+    def test_forces_submit_picks_tool(self, curator_with_key, make_event):
         e = make_event()
-        response_text = f'```json\n[{{"event_id": {e.id}, "editorial_note": "Nice"}}]\n```'
+        mock_client = self._client_returning(self._tool_use([]))
+
+        with patch.object(curator_with_key, "_get_client", return_value=mock_client):
+            curator_with_key.curate_editors_picks([e], max_picks=5)
 
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(text=response_text)]
+        kwargs = mock_client.messages.calls[-1]
+        assert kwargs["tool_choice"] == {"type": "tool", "name": "submit_picks"}
+        assert kwargs["tools"][0]["name"] == "submit_picks"
 
-        mock_client = MagicMock()
-        mock_client.messages.create.return_value = mock_response
+    def test_tool_use_after_text_block(self, curator_with_key, make_event):
+        """The tool call is found even if the model emits text first."""
+        e = make_event()
+        mock_client = self._client_returning(
+            SimpleNamespace(type="text", text="Here you go"),
+            self._tool_use([{"event_id": e.id, "editorial_note": "Nice"}]),
+        )
 
         with patch.object(curator_with_key, "_get_client", return_value=mock_client):
             picks = curator_with_key.curate_editors_picks([e], max_picks=5)
@@ -164,6 +205,16 @@ class TestCurateEditorsPicksAPI:
         assert len(picks) == 1
         assert picks[0]["editorial_note"] == "Nice"
 
+    def test_no_tool_use_falls_back(self, curator_with_key, make_event):
+        events = [make_event(title=f"E{i}") for i in range(5)]
+        mock_client = self._client_returning(SimpleNamespace(type="text", text="[]"))
+
+        with patch.object(curator_with_key, "_get_client", return_value=mock_client):
+            picks = curator_with_key.curate_editors_picks(events, max_picks=3)
+
+        assert len(picks) == 3
+        assert all(p["editorial_note"] == "" for p in picks)
+
     def test_api_error_falls_back(self, curator_with_key, make_event):
         events = [make_event(title=f"E{i}") for i in range(5)]
 
@@ -176,19 +227,25 @@ class TestCurateEditorsPicksAPI:
     def test_invalid_ids_filtered(self, curator_with_key, make_event):
         """API returns event_id that doesn't exist in the events list."""
         e = make_event()
-        response_json = json.dumps([
+        mock_client = self._client_returning(self._tool_use([
             {"event_id": e.id, "editorial_note": "Real"},
             {"event_id": 99999, "editorial_note": "Fake"},
-        ])
-
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(text=response_json)]
-
-        mock_client = MagicMock()
-        mock_client.messages.create.return_value = mock_response
+        ]))
 
         with patch.object(curator_with_key, "_get_client", return_value=mock_client):
             picks = curator_with_key.curate_editors_picks([e], max_picks=5)
 
         assert len(picks) == 1
         assert picks[0]["event_id"] == e.id
+
+
+# --- _get_client ---
+
+class TestGetClient:
+    def test_client_reused(self, curator_with_key):
+        fake_anthropic = MagicMock()
+        with patch.dict("sys.modules", {"anthropic": fake_anthropic}):
+            first = curator_with_key._get_client()
+            second = curator_with_key._get_client()
+        assert first is second
+        fake_anthropic.Anthropic.assert_called_once_with(api_key="test-key-123")
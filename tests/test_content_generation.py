@@ -78,6 +78,18 @@ class TestRenderEventCard:
         html = gen._render_event_card(event)
         assert "Venue TBA" in html
 
+    def test_title_and_venue_escaped(self, gen, make_event):
+        event = make_event(title="Rock & Roll <Live>", venue_name='The "Big" Room')
+        html = gen._render_event_card(event)
+        assert "Rock &amp; Roll &lt;Live&gt;" in html
+        assert "The &quot;Big&quot; Room" in html
+        assert "<Live>" not in html
+
+    def test_ticket_url_escaped(self, gen, make_event):
+        event = make_event(ticket_url='https://x.example.com/?a=1&b="2"')
+        html = gen._render_event_card(event)
+        assert 'href="https://x.example.com/?a=1&amp;b=&quot;2&quot;"' in html
+
 
 # --- generate_selling_fast_alert ---
 
@@ -108,3 +120,85 @@ class TestGenerateSellingFastAlert:
         # Show 8 and Show 9 should NOT appear (0-indexed, so shows 0-7 = 8 events)
         assert "Show 7" in html
         assert "Show 8" not in html
+
+
+# --- generate_weekly_newsletter ---
+
+class TestGenerateWeeklyNewsletter:
+    @pytest.fixture(autouse=True)
+    def no_api_key(self, gen):
+        gen.ai_curator.api_key = None
+
+    def test_price_tiers(self, gen, make_event):
+        events = [
+            make_event(title="Free Gig", price_min=0),
+            make_event(title="Cheap Gig", price_min=15.0),
+            make_event(title="Posh Gig", price_min=120.0),
+        ]
+        html = gen.generate_weekly_newsletter(events)
+        paid = html.split("<!-- PAYWALL -->")[1]
+        assert "<h2>Free Events</h2>\n<p><strong>Free Gig" in paid
+        assert "<h2>Under £20</h2>\n<p><strong>Cheap Gig" in paid
+        assert "<h2>Premium Experiences</h2>\n<p><strong>Posh Gig" in paid
+
+    def test_uncategorised_events_grouped_as_other(self, gen, make_event):
+        html = gen.generate_weekly_newsletter([make_event(title="Mystery")])
+        assert "<h2>Other</h2>" in html
+
+    def test_selling_fast_above_paywall(self, gen, make_event):
+        events = [make_event(title="Hot Show", status=EventStatus.SELLING_FAST)]
+        html = gen.generate_weekly_newsletter(events)
+        free = html.split("<!-- PAYWALL -->")[0]
+        assert "<h2>Selling Fast</h2>" in free
+        assert "Hot Show" in free
+
+    def test_just_announced(self, gen, make_event):
+        events = [
+            make_event(title="Brand New", first_seen_at=datetime.utcnow()),
+            make_event(title="Old News", first_seen_at=datetime(2020, 1, 1)),
+        ]
+        html = gen.generate_weekly_newsletter(events)
+        section = html.split("<h2>Just Announced</h2>")[1].split("<h2>")[0]
+        assert "Brand New" in section
+        assert "Old News" not in section
+
+    def test_unsaved_events_keep_their_own_price(self, gen, make_event):
+        events = [
+            make_event(title="Cheap Gig", price_min=15.0),
+            make_event(title="Posh Gig", price_min=120.0),
+        ]
+        for e in events:
+            e.id = None
+        html = gen.generate_weekly_newsletter(events)
+        assert "From £15.00" in html
+        assert "From £120.00" in html
+
+    def test_price_cache_not_reused_after_render(self, gen, make_event):
+        e = make_event(price_min=25.0, price_max=75.0)
+        gen.generate_weekly_newsletter([e])
+        e.price_min, e.price_max = 30.0, None
+        assert "From £30.00" in gen._render_event_card(e)
+
+    def test_categories_alphabetical_and_capped(self, gen, make_event, make_category):
+        music, arts = make_category("Music"), make_category("Arts")
+        events = [make_event(title=f"Gig {i}") for i in range(25)]
+        for e in events:
+            e.categories = [music]
+        events[0].categories = [music, arts]
+        html = gen.generate_weekly_newsletter(events)
+        assert html.index("<h2>Arts</h2>") < html.index("<h2>Music</h2>")
+        music_section = html.split("<h2>Music</h2>")[1].split("<h2>")[0]
+        assert "Gig 19<" in music_section
+        assert "Gig 20<" not in music_section
+
+    def test_price_tier_boundaries(self, gen, make_event):
+        events = [
+            make_event(title="Twenty", price_min=20.0),
+            make_event(title="Twenty-ish", price_min=20.01),
+        ]
+        html = gen.generate_weekly_newsletter(events)
+        under_20 = html.split("<h2>Under £20</h2>")[1].split("<h2>")[0]
+        premium = html.split("<h2>Premium Experiences</h2>")[1].split("<h2>")[0]
+        assert "Twenty<" in under_20
+        assert "Twenty-ish" in premium
+        assert "Twenty-ish" not in under_20
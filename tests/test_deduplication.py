@@ -1,43 +1,54 @@
 """Tests for EventAggregator deduplication — uses db_session fixture."""
+import time
+
 import pytest
 from datetime import datetime
+from unittest.mock import MagicMock, patch
 
-from app.models.database import Event, EventStatus
+from app.models.database import DataSource, Event, EventStatus
 from app.data_sources.base import EventData
 from app.services.event_aggregator import EventAggregator
 
 
+@pytest.fixture
+def agg(db_session):
+    return EventAggregator(db_session)
+
+
 # --- _similarity ---
 
 class TestSimilarity:
-    @pytest.fixture(autouse=True)
-    def setup(self, db_session):
-        self.agg = EventAggregator(db_session)
+    def test_identical_strings(self, agg):
+        assert agg._similarity("hello world", "hello world") == 1.0
 
-    def test_identical_strings(self):
-        assert self.agg._similarity("hello world", "hello world") == 1.0
+    def test_completely_different(self, agg):
+        assert agg._similarity("abc", "xyz") < 0.2
 
-    def test_completely_different(self):
-        assert self.agg._similarity("abc", "xyz") < 0.2
-
-    def test_partial_match_above_threshold(self):
+    def test_partial_match_above_threshold(self, agg):
         """Slightly different titles should still score > 0.85."""
-        sim = self.agg._similarity(
+        sim = agg._similarity(
             "taylor swift the eras tour",
             "taylor swift - the eras tour",
         )
         assert sim > 0.85
 
+    def test_empty_strings_identical(self, agg):
+        assert agg._similarity("", "") == 1.0
+
+    def test_below_threshold_cut_off(self, agg):
+        """Scores under the threshold are cut off to 0.0."""
+        sim = agg._similarity("jazz", "jazz at the royal albert hall", threshold=0.85)
+        assert sim == 0.0
+
+    def test_threshold_does_not_change_exact_ratio_above_it(self, agg):
+        a, b = "taylor swift the eras tour", "taylor swift - the eras tour"
+        assert agg._similarity(a, b, threshold=0.85) == agg._similarity(a, b)
+
 
 # --- _find_duplicate ---
 
 class TestFindDuplicate:
-    @pytest.fixture(autouse=True)
-    def setup(self, db_session):
-        self.db = db_session
-        self.agg = EventAggregator(db_session)
-
-    def _add_event(self, title="Test Event", venue="Test Venue", date=None):
+    def _add_event(self, db, title="Test Event", venue="Test Venue", date=None):
         if date is None:
             date = datetime(2026, 3, 15, 19, 30)
         event = Event(
@@ -48,8 +59,8 @@ class TestFindDuplicate:
             source_id="exist-1",
             slug="exist-1",
         )
-        self.db.add(event)
-        self.db.commit()
+        db.add(event)
+        db.commit()
         return event
 
     def _make_event_data(self, title="Test Event", venue="Test Venue", date=None):
@@ -63,58 +74,230 @@ class TestFindDuplicate:
             venue_name=venue,
         )
 
-    def test_exact_match_found(self):
-        self._add_event("Taylor Swift Eras Tour", "Wembley Stadium")
-        ed = self._make_event_data("Taylor Swift Eras Tour", "Wembley Stadium")
-        assert self.agg._find_duplicate(ed) is not None
+    # (existing title, venue, date), (incoming title, venue, date), duplicate?
+    @pytest.mark.parametrize(
+        "existing, incoming, is_duplicate",
+        [
+            pytest.param(
+                ("Taylor Swift Eras Tour", "Wembley Stadium", None),
+                ("Taylor Swift Eras Tour", "Wembley Stadium", None),
+                True,
+                id="exact_match_found",
+            ),
+            pytest.param(
+                ("Taylor Swift - The Eras Tour", "Wembley Stadium", None),
+                ("Taylor Swift: The Eras Tour", "Wembley Stadium", None),
+                True,
+                id="fuzzy_title_match_found",
+            ),
+            pytest.param(
+                ("Taylor Swift Eras Tour", "Wembley Stadium", None),
+                ("Adele World Tour", "Wembley Stadium", None),
+                False,
+                id="different_title_not_found",
+            ),
+            pytest.param(
+                ("Taylor Swift Eras Tour", "Wembley Stadium", datetime(2026, 3, 15)),
+                ("Taylor Swift Eras Tour", "Wembley Stadium", datetime(2026, 4, 15)),
+                False,
+                id="different_date_not_found",
+            ),
+            pytest.param(
+                ("Jazz Night", "Ronnie Scotts", None),
+                ("Jazz Night", "Royal Albert Hall", None),
+                False,
+                id="similar_title_different_venue_not_found",
+            ),
+            # Both venues None → venue similarity=1.0 so duplicate found
+            pytest.param(
+                ("Same Event", None, None),
+                ("Same Event", None, None),
+                True,
+                id="both_venues_none_duplicate_found",
+            ),
+        ],
+    )
+    def test_find_duplicate(self, db_session, agg, existing, incoming, is_duplicate):
+        self._add_event(db_session, *existing)
+        ed = self._make_event_data(*incoming)
+        assert (agg._find_duplicate(ed) is not None) is is_duplicate
 
-    def test_fuzzy_title_match_found(self):
-        self._add_event("Taylor Swift - The Eras Tour", "Wembley Stadium")
-        ed = self._make_event_data("Taylor Swift: The Eras Tour", "Wembley Stadium")
-        assert self.agg._find_duplicate(ed) is not None
 
-    def test_different_title_not_found(self):
-        self._add_event("Taylor Swift Eras Tour", "Wembley Stadium")
-        ed = self._make_event_data("Adele World Tour", "Wembley Stadium")
-        assert self.agg._find_duplicate(ed) is None
+# --- _process_events ---
 
-    def test_different_date_not_found(self):
-        self._add_event("Taylor Swift Eras Tour", "Wembley Stadium", datetime(2026, 3, 15))
-        ed = self._make_event_data("Taylor Swift Eras Tour", "Wembley Stadium", datetime(2026, 4, 15))
-        assert self.agg._find_duplicate(ed) is None
+class TestProcessEvents:
+    def _event_data(self, title, source_name="src_a", source_id="a-1", venue="Test Venue"):
+        return EventData(
+            title=title,
+            start_date=datetime(2026, 3, 15, 19, 30),
+            source_name=source_name,
+            source_id=source_id,
+            venue_name=venue,
+        )
+
+    def test_new_events_created(self, db_session, agg):
+        saved = agg._process_events(
+            [self._event_data("Show A", source_id="a-1"),
+             self._event_data("Totally Different", source_id="a-2")],
+            "src_a",
+        )
+        assert saved == 2
+        assert db_session.query(Event).count() == 2
+
+    def test_existing_event_updated(self, db_session, agg):
+        agg._process_events([self._event_data("Old Title")], "src_a")
+        saved = agg._process_events([self._event_data("New Title")], "src_a")
+        assert saved == 1
+        events = db_session.query(Event).all()
+        assert [e.title for e in events] == ["New Title"]
+
+    def test_cross_source_duplicate_skipped(self, db_session, agg):
+        agg._process_events([self._event_data("Jazz Night")], "src_a")
+        saved = agg._process_events(
+            [self._event_data("Jazz Night", source_name="src_b", source_id="b-1")],
+            "src_b",
+        )
+        assert saved == 0
+        assert db_session.query(Event).count() == 1
 
-    def test_similar_title_different_venue_not_found(self):
-        self._add_event("Jazz Night", "Ronnie Scotts")
-        ed = self._make_event_data("Jazz Night", "Royal Albert Hall")
-        assert self.agg._find_duplicate(ed) is None
+    def test_normalized_columns_populated(self, db_session, agg):
+        agg._process_events(
+            [self._event_data("ＪＡＺＺ Night ", venue="The Jazz CAFÉ")], "src_a"
+        )
+        event = db_session.query(Event).one()
+        assert event.title_normalized == "jazz night"
+        assert event.venue_normalized == "the jazz café"
 
-    def test_both_venues_none_duplicate_found(self):
-        """Both venues None → venue similarity=1.0 so duplicate found."""
-        self._add_event("Same Event", venue=None)
-        ed = self._make_event_data("Same Event", venue=None)
-        assert self.agg._find_duplicate(ed) is not None
+    def test_iterator_processed_in_committed_batches(self, db_session, agg):
+        events = iter([
+            self._event_data("Jazz Night", source_id="a-1"),
+            self._event_data("Jazz Night", source_name="src_b", source_id="b-1"),
+            self._event_data("Folk Night", source_id="a-2"),
+        ])
+        with patch("app.services.event_aggregator._PROCESS_BATCH_SIZE", 1):
+            saved = agg._process_events(events, "src_a")
+        # Later batches see rows committed by earlier ones
+        assert saved == 2
+        assert db_session.query(Event).count() == 2
+
+    def test_repeated_source_id_within_one_batch_updates(self, db_session, agg):
+        saved = agg._process_events(
+            [self._event_data("Taylor Swift: The Eras Tour", source_id="1"),
+             self._event_data("Taylor Swift: The Eras Tour (Night 2)", source_id="1")],
+            "src_a",
+        )
+        assert saved == 2
+        events = db_session.query(Event).all()
+        assert [e.title for e in events] == ["Taylor Swift: The Eras Tour (Night 2)"]
+
+    def test_near_duplicate_within_one_batch_not_inserted(self, db_session, agg):
+        saved = agg._process_events(
+            [self._event_data("Taylor Swift: The Eras Tour", source_id="1"),
+             self._event_data("Taylor Swift: The Eras Tour", source_id="1"),
+             self._event_data("Taylor Swift - The Eras Tour", source_id="2")],
+            "src_a",
+        )
+        assert saved == 2
+        assert db_session.query(Event).count() == 1
+
+    def test_find_duplicate_returns_pending_event(self, agg):
+        pending = Event(title="Jazz Night")
+        match = agg._find_duplicate(
+            self._event_data("Jazz Night"), [(pending, "jazz night", "test venue")]
+        )
+        assert match is pending
+
+
+# --- fetch_all_events ---
+
+class TestFetchAllEvents:
+    def _source(self, name, events=None, error=None):
+        source = MagicMock(source_type="api", display_name=name.title())
+        source.name = name
+        if error is not None:
+            source.fetch_events.side_effect = error
+        else:
+            source.fetch_events.return_value = events
+        return source
+
+    def test_failing_source_does_not_block_others(self, db_session, agg):
+        good = self._source("good", events=[EventData(
+            title="Gig",
+            start_date=datetime(2026, 3, 15, 19, 30),
+            source_name="good",
+            source_id="g-1",
+        )])
+        bad = self._source("bad", error=RuntimeError("boom"))
+
+        with patch(
+            "app.services.event_aggregator.get_enabled_sources",
+            return_value=[bad, good],
+        ):
+            results = agg.fetch_all_events(datetime(2026, 3, 1), datetime(2026, 4, 1))
+
+        assert results == {"bad": 0, "good": 1}
+        assert db_session.query(Event).count() == 1
+
+    def test_results_processed_in_source_priority_order(self, db_session, agg):
+        """A slow high-priority source still wins cross-source dedup."""
+        def gig(source_name):
+            return EventData(
+                title="Jazz Night",
+                start_date=datetime(2026, 3, 15, 19, 30),
+                source_name=source_name,
+                source_id=f"{source_name}-1",
+                venue_name="Ronnie Scotts",
+            )
+
+        first = self._source("first")
+        first.fetch_events.side_effect = lambda *args: time.sleep(0.05) or [gig("first")]
+        second = self._source("second", events=[gig("second")])
+
+        with patch(
+            "app.services.event_aggregator.get_enabled_sources",
+            return_value=[first, second],
+        ):
+            agg.fetch_all_events(datetime(2026, 3, 1), datetime(2026, 4, 1))
+
+        assert [e.source_name for e in db_session.query(Event)] == ["first"]
+
+
+# --- _update_source_tracking ---
+
+class TestUpdateSourceTracking:
+    def test_average_fetch_time_is_true_mean(self, db_session, agg):
+        for duration in (1.0, 2.0, 6.0):
+            agg._update_source_tracking("src", "api", success=True, fetch_duration=duration)
+
+        source = db_session.query(DataSource).one()
+        assert source.successful_fetch_count == 3
+        assert source.average_fetch_time == pytest.approx(3.0)
+
+    def test_failure_leaves_average_untouched(self, db_session, agg):
+        agg._update_source_tracking("src", "api", success=True, fetch_duration=4.0)
+        agg._update_source_tracking("src", "api", success=False, error="boom")
+
+        source = db_session.query(DataSource).one()
+        assert source.average_fetch_time == pytest.approx(4.0)
+        assert source.last_error == "boom"
 
 
 # --- _calculate_availability_percentage ---
 
 class TestCalculateAvailabilityPercentage:
-    @pytest.fixture(autouse=True)
-    def setup(self, db_session):
-        self.agg = EventAggregator(db_session)
-
-    def test_normal(self):
-        result = self.agg._calculate_availability_percentage(200, 1000)
+    def test_normal(self, agg):
+        result = agg._calculate_availability_percentage(200, 1000)
         assert result == pytest.approx(20.0)
 
-    def test_none_tickets_returns_none(self):
-        assert self.agg._calculate_availability_percentage(None, 1000) is None
+    def test_none_tickets_returns_none(self, agg):
+        assert agg._calculate_availability_percentage(None, 1000) is None
 
-    def test_none_total_returns_none(self):
-        assert self.agg._calculate_availability_percentage(200, None) is None
+    def test_none_total_returns_none(self, agg):
+        assert agg._calculate_availability_percentage(200, None) is None
 
-    def test_zero_total_returns_none(self):
-        assert self.agg._calculate_availability_percentage(200, 0) is None
+    def test_zero_total_returns_none(self, agg):
+        assert agg._calculate_availability_percentage(200, 0) is None
 
-    def test_zero_available_returns_none(self):
+    def test_zero_available_returns_none(self, agg):
         """0 is falsy, so `not tickets_available` is True → returns None."""
-        assert self.agg._calculate_availability_percentage(0, 1000) is None
+        assert agg._calculate_availability_percentage(0, 1000) is None
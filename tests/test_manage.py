@@ -0,0 +1,85 @@
+"""Tests for manage.py schema upgrades — fresh in-memory SQLite per test."""
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+from manage import upgrade_schema
+
+
+@pytest.fixture
+def old_engine():
+    """Database holding events/data_sources tables from before the new columns."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE events ("
+            "id INTEGER PRIMARY KEY, title VARCHAR(500) NOT NULL, "
+            "start_date DATETIME NOT NULL, venue_name VARCHAR(255), "
+            "source_name VARCHAR(100) NOT NULL, source_id VARCHAR(255) NOT NULL)"
+        ))
+        conn.execute(text(
+            "INSERT INTO events (title, start_date, venue_name, source_name, source_id) "
+            "VALUES ('Jazz NIGHT', '2026-03-15 19:30:00', 'Ronnie Scotts', 'src', 'a-1')"
+        ))
+        conn.execute(text(
+            "CREATE TABLE data_sources ("
+            "id INTEGER PRIMARY KEY, name VARCHAR(100) NOT NULL, "
+            "source_type VARCHAR(50) NOT NULL, average_fetch_time FLOAT)"
+        ))
+        conn.execute(text(
+            "INSERT INTO data_sources (name, source_type, average_fetch_time) "
+            "VALUES ('timed', 'api', 2.5), ('untimed', 'api', NULL)"
+        ))
+    yield engine
+    engine.dispose()
+
+
+class TestUpgradeSchema:
+    def test_adds_missing_columns_and_indexes(self, old_engine):
+        added = upgrade_schema(old_engine)
+
+        assert "events.title_normalized" in added
+        assert "events.venue_normalized" in added
+        inspector = inspect(old_engine)
+        index_names = {i["name"] for i in inspector.get_indexes("events")}
+        assert "ix_events_title_normalized" in index_names
+        assert "data_sources" in inspector.get_table_names()
+
+    def test_backfills_normalized_columns(self, old_engine):
+        upgrade_schema(old_engine)
+
+        with old_engine.connect() as conn:
+            row = conn.execute(
+                text("SELECT title_normalized, venue_normalized FROM events")
+            ).one()
+        assert tuple(row) == ("jazz night", "ronnie scotts")
+
+    def test_seeds_fetch_totals_from_average(self, old_engine):
+        added = upgrade_schema(old_engine)
+
+        assert "data_sources.successful_fetch_count" in added
+        with old_engine.connect() as conn:
+            rows = conn.execute(text(
+                "SELECT name, total_fetch_time, successful_fetch_count "
+                "FROM data_sources ORDER BY name"
+            )).all()
+        assert [tuple(r) for r in rows] == [("timed", 2.5, 1), ("untimed", None, None)]
+
+    def test_drops_removed_indexes(self, old_engine):
+        with old_engine.begin() as conn:
+            conn.execute(text("ALTER TABLE events ADD COLUMN popularity_score FLOAT"))
+            conn.execute(text(
+                "CREATE INDEX ix_events_popularity_score ON events (popularity_score)"
+            ))
+        upgrade_schema(old_engine)
+
+        index_names = {i["name"] for i in inspect(old_engine).get_indexes("events")}
+        assert "ix_events_popularity_score" not in index_names
+
+    def test_rerun_is_a_no_op(self, old_engine):
+        upgrade_schema(old_engine)
+        assert upgrade_schema(old_engine) == []
@@ -1,87 +1,93 @@
 """Tests for scraper date/price parsing — pure methods, no HTTP, no DB."""
 import pytest
+from bs4 import BeautifulSoup
 from datetime import datetime
 
 
+@pytest.fixture(scope="module")
+def make_card():
+    """Factory for a minimal BeautifulSoup Tag with the given text."""
+    def _make_card(text):
+        return BeautifulSoup(f"<div>{text}</div>", "lxml").find("div")
+    return _make_card
+
+
 # =====================================================================
 # O2 Arena
 # =====================================================================
 
-class TestO2ArenaParseDateText:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.o2_arena import O2ArenaScraper
-        self.scraper = O2ArenaScraper()
+@pytest.fixture(scope="module")
+def o2_scraper():
+    from app.data_sources.scrapers.o2_arena import O2ArenaScraper
+    return O2ArenaScraper()
 
-    def test_standard_format(self):
-        assert self.scraper._parse_date_text("13 Feb 2026") == datetime(2026, 2, 13)
 
-    def test_full_month_name(self):
-        assert self.scraper._parse_date_text("13 February 2026") == datetime(2026, 2, 13)
+class TestO2ArenaParseDateText:
+    def test_standard_format(self, o2_scraper):
+        assert o2_scraper._parse_date_text("13 Feb 2026") == datetime(2026, 2, 13)
+
+    def test_full_month_name(self, o2_scraper):
+        assert o2_scraper._parse_date_text("13 February 2026") == datetime(2026, 2, 13)
 
-    def test_no_spaces(self):
-        assert self.scraper._parse_date_text("13Feb2026") == datetime(2026, 2, 13)
+    def test_no_spaces(self, o2_scraper):
+        assert o2_scraper._parse_date_text("13Feb2026") == datetime(2026, 2, 13)
 
-    def test_invalid_returns_none(self):
-        assert self.scraper._parse_date_text("no date here") is None
+    def test_invalid_returns_none(self, o2_scraper):
+        assert o2_scraper._parse_date_text("no date here") is None
 
-    def test_empty_returns_none(self):
-        assert self.scraper._parse_date_text("") is None
+    def test_empty_returns_none(self, o2_scraper):
+        assert o2_scraper._parse_date_text("") is None
 
-    def test_day_with_prefix_text(self):
+    def test_day_with_prefix_text(self, o2_scraper):
         """Date embedded in surrounding text."""
-        assert self.scraper._parse_date_text("Opens 20 Mar 2026") == datetime(2026, 3, 20)
+        assert o2_scraper._parse_date_text("Opens 20 Mar 2026") == datetime(2026, 3, 20)
 
 
 class TestO2ArenaParsePrice:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.o2_arena import O2ArenaScraper
-        self.scraper = O2ArenaScraper()
+    def test_free_entry(self, o2_scraper):
+        assert o2_scraper._parse_price("Free entry") == (0.0, 0.0)
 
-    def test_free_entry(self):
-        assert self.scraper._parse_price("Free entry") == (0.0, 0.0)
+    def test_single_price(self, o2_scraper):
+        assert o2_scraper._parse_price("£25.00") == (25.0, 25.0)
 
-    def test_single_price(self):
-        assert self.scraper._parse_price("£25.00") == (25.0, 25.0)
+    def test_price_range(self, o2_scraper):
+        assert o2_scraper._parse_price("£25.00 - £75.00") == (25.0, 75.0)
 
-    def test_price_range(self):
-        assert self.scraper._parse_price("£25.00 - £75.00") == (25.0, 75.0)
-
-    def test_no_pound_sign_ignored(self):
+    def test_no_pound_sign_ignored(self, o2_scraper):
         """Prices without £ sign should not match."""
-        assert self.scraper._parse_price("Tickets from 25") == (None, None)
+        assert o2_scraper._parse_price("Tickets from 25") == (None, None)
 
-    def test_none_input(self):
-        assert self.scraper._parse_price(None) == (None, None)
+    def test_none_input(self, o2_scraper):
+        assert o2_scraper._parse_price(None) == (None, None)
 
 
 # =====================================================================
 # Barbican
 # =====================================================================
 
-class TestBarbicanParseDateRangeText:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.barbican import BarbicanScraper
-        self.scraper = BarbicanScraper()
+@pytest.fixture(scope="module")
+def barbican_scraper():
+    from app.data_sources.scrapers.barbican import BarbicanScraper
+    return BarbicanScraper()
 
-    def test_full_range(self):
-        result = self.scraper._parse_date_range_text("Fri 30 Jan – Sun 19 Apr 2026")
+
+class TestBarbicanParseDateRangeText:
+    def test_full_range(self, barbican_scraper):
+        result = barbican_scraper._parse_date_range_text("Fri 30 Jan – Sun 19 Apr 2026")
         assert result == datetime(2026, 1, 30)
 
-    def test_single_date(self):
-        result = self.scraper._parse_date_range_text("15 Mar 2026")
+    def test_single_date(self, barbican_scraper):
+        result = barbican_scraper._parse_date_range_text("15 Mar 2026")
         assert result == datetime(2026, 3, 15)
 
-    def test_empty_returns_none(self):
-        assert self.scraper._parse_date_range_text("") is None
+    def test_empty_returns_none(self, barbican_scraper):
+        assert barbican_scraper._parse_date_range_text("") is None
 
-    def test_none_returns_none(self):
-        assert self.scraper._parse_date_range_text(None) is None
+    def test_none_returns_none(self, barbican_scraper):
+        assert barbican_scraper._parse_date_range_text(None) is None
 
-    def test_range_with_hyphen(self):
-        result = self.scraper._parse_date_range_text("10 Feb - 20 Mar 2026")
+    def test_range_with_hyphen(self, barbican_scraper):
+        result = barbican_scraper._parse_date_range_text("10 Feb - 20 Mar 2026")
         assert result == datetime(2026, 2, 10)
 
 
@@ -89,221 +95,211 @@ class TestBarbicanParseDateRangeText:
 # Official London Theatre
 # =====================================================================
 
+@pytest.fixture(scope="module")
+def olt_scraper():
+    from app.data_sources.scrapers.official_london_theatre import OfficialLondonTheatreScraper
+    return OfficialLondonTheatreScraper()
+
+
 class TestOLTParseAcfDate:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.official_london_theatre import OfficialLondonTheatreScraper
-        self.scraper = OfficialLondonTheatreScraper()
+    def test_valid_date(self, olt_scraper):
+        assert olt_scraper._parse_acf_date("20260214") == datetime(2026, 2, 14)
 
-    def test_valid_date(self):
-        assert self.scraper._parse_acf_date("20260214") == datetime(2026, 2, 14)
+    def test_none_returns_none(self, olt_scraper):
+        assert olt_scraper._parse_acf_date(None) is None
 
-    def test_none_returns_none(self):
-        assert self.scraper._parse_acf_date(None) is None
+    def test_empty_string_returns_none(self, olt_scraper):
+        assert olt_scraper._parse_acf_date("") is None
 
-    def test_empty_string_returns_none(self):
-        assert self.scraper._parse_acf_date("") is None
+    def test_wrong_length_returns_none(self, olt_scraper):
+        assert olt_scraper._parse_acf_date("2026021") is None
 
-    def test_wrong_length_returns_none(self):
-        assert self.scraper._parse_acf_date("2026021") is None
+    def test_invalid_date_returns_none(self, olt_scraper):
+        assert olt_scraper._parse_acf_date("20261332") is None
 
-    def test_invalid_date_returns_none(self):
-        assert self.scraper._parse_acf_date("20261332") is None
+    def test_non_digit_returns_none(self, olt_scraper):
+        assert olt_scraper._parse_acf_date("2026-2-1") is None
 
 
 # =====================================================================
 # KOKO
 # =====================================================================
 
+@pytest.fixture(scope="module")
+def koko_scraper():
+    from app.data_sources.scrapers.koko import KokoScraper
+    return KokoScraper()
+
+
 class TestKokoParseEventDate:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.koko import KokoScraper
-        self.scraper = KokoScraper()
+    def test_us_format(self, koko_scraper):
+        assert koko_scraper._parse_event_date("February 14, 2026") == datetime(2026, 2, 14)
 
-    def test_us_format(self):
-        assert self.scraper._parse_event_date("February 14, 2026") == datetime(2026, 2, 14)
+    def test_uk_format(self, koko_scraper):
+        assert koko_scraper._parse_event_date("14 February 2026") == datetime(2026, 2, 14)
 
-    def test_uk_format(self):
-        assert self.scraper._parse_event_date("14 February 2026") == datetime(2026, 2, 14)
+    def test_abbreviated_month(self, koko_scraper):
+        assert koko_scraper._parse_event_date("14 Feb 2026") == datetime(2026, 2, 14)
+        assert koko_scraper._parse_event_date("Feb 14, 2026") == datetime(2026, 2, 14)
 
-    def test_invalid_returns_none(self):
-        assert self.scraper._parse_event_date("not a date") is None
+    def test_invalid_returns_none(self, koko_scraper):
+        assert koko_scraper._parse_event_date("not a date") is None
 
-    def test_none_returns_none(self):
-        assert self.scraper._parse_event_date(None) is None
+    def test_none_returns_none(self, koko_scraper):
+        assert koko_scraper._parse_event_date(None) is None
 
 
 class TestKokoParseDoorTime:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.koko import KokoScraper
-        self.scraper = KokoScraper()
+    def test_10pm(self, koko_scraper):
+        assert koko_scraper._parse_door_time("10:00 pm") == (22, 0)
 
-    def test_10pm(self):
-        assert self.scraper._parse_door_time("10:00 pm") == (22, 0)
+    def test_930am(self, koko_scraper):
+        assert koko_scraper._parse_door_time("9:30 am") == (9, 30)
 
-    def test_930am(self):
-        assert self.scraper._parse_door_time("9:30 am") == (9, 30)
+    def test_12pm_noon(self, koko_scraper):
+        assert koko_scraper._parse_door_time("12:00 pm") == (12, 0)
 
-    def test_12pm_noon(self):
-        assert self.scraper._parse_door_time("12:00 pm") == (12, 0)
+    def test_12am_midnight(self, koko_scraper):
+        assert koko_scraper._parse_door_time("12:00 am") == (0, 0)
 
-    def test_12am_midnight(self):
-        assert self.scraper._parse_door_time("12:00 am") == (0, 0)
-
-    def test_invalid_returns_none(self):
-        assert self.scraper._parse_door_time("invalid") is None
+    def test_invalid_returns_none(self, koko_scraper):
+        assert koko_scraper._parse_door_time("invalid") is None
 
 
 # =====================================================================
 # Roundhouse
 # =====================================================================
 
-class TestRoundhouseParseDateText:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.roundhouse import RoundhouseScraper
-        self.scraper = RoundhouseScraper()
+@pytest.fixture(scope="module")
+def roundhouse_scraper():
+    from app.data_sources.scrapers.roundhouse import RoundhouseScraper
+    return RoundhouseScraper()
 
-    def test_single_date_no_year(self):
+
+class TestRoundhouseParseDateText:
+    def test_single_date_no_year(self, roundhouse_scraper):
         """Current year is used when no year is provided."""
-        result = self.scraper._parse_date_text("Fri 20 February")
+        result = roundhouse_scraper._parse_date_text("Fri 20 February")
         assert result is not None
         assert result.month == 2
         assert result.day == 20
 
-    def test_range_same_month(self):
-        result = self.scraper._parse_date_text("Mon 16-Wed 18 February")
+    def test_range_same_month(self, roundhouse_scraper):
+        result = roundhouse_scraper._parse_date_text("Mon 16-Wed 18 February")
         assert result is not None
         assert result.month == 2
         assert result.day == 16
 
-    def test_two_digit_year(self):
-        result = self.scraper._parse_date_text("Tue 17 Feb 26")
+    def test_two_digit_year(self, roundhouse_scraper):
+        result = roundhouse_scraper._parse_date_text("Tue 17 Feb 26")
         assert result == datetime(2026, 2, 17)
 
-    def test_en_dash_range(self):
-        result = self.scraper._parse_date_text("Tue 17 Feb 26\u2013Wed 18 Feb 26")
+    def test_en_dash_range(self, roundhouse_scraper):
+        result = roundhouse_scraper._parse_date_text("Tue 17 Feb 26\u2013Wed 18 Feb 26")
         assert result == datetime(2026, 2, 17)
 
-    def test_empty_returns_none(self):
-        assert self.scraper._parse_date_text("") is None
+    def test_empty_returns_none(self, roundhouse_scraper):
+        assert roundhouse_scraper._parse_date_text("") is None
 
 
 # =====================================================================
 # Alexandra Palace
 # =====================================================================
 
-class TestAlexandraPalaceParseDateText:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.alexandra_palace import AlexandraPalaceScraper
-        self.scraper = AlexandraPalaceScraper()
+@pytest.fixture(scope="module")
+def alexandra_palace_scraper():
+    from app.data_sources.scrapers.alexandra_palace import AlexandraPalaceScraper
+    return AlexandraPalaceScraper()
+
 
-    def test_standard_format(self):
-        assert self.scraper._parse_date_text("14 Feb 2026") == datetime(2026, 2, 14)
+class TestAlexandraPalaceParseDateText:
+    def test_standard_format(self, alexandra_palace_scraper):
+        assert alexandra_palace_scraper._parse_date_text("14 Feb 2026") == datetime(2026, 2, 14)
 
-    def test_with_day_name(self):
-        assert self.scraper._parse_date_text("Sat 14 Feb 2026") == datetime(2026, 2, 14)
+    def test_with_day_name(self, alexandra_palace_scraper):
+        assert alexandra_palace_scraper._parse_date_text("Sat 14 Feb 2026") == datetime(2026, 2, 14)
 
-    def test_range(self):
-        result = self.scraper._parse_date_text("14 Feb \u2013 16 Feb 2026")
+    def test_range(self, alexandra_palace_scraper):
+        result = alexandra_palace_scraper._parse_date_text("14 Feb \u2013 16 Feb 2026")
         assert result == datetime(2026, 2, 14)
 
-    def test_empty_returns_none(self):
-        assert self.scraper._parse_date_text("") is None
+    def test_empty_returns_none(self, alexandra_palace_scraper):
+        assert alexandra_palace_scraper._parse_date_text("") is None
 
-    def test_no_year_returns_none(self):
+    def test_no_year_returns_none(self, alexandra_palace_scraper):
         """Alexandra Palace scraper requires a year (unlike Roundhouse)."""
-        assert self.scraper._parse_date_text("14 Feb") is None
+        assert alexandra_palace_scraper._parse_date_text("14 Feb") is None
 
 
 class TestAlexandraPalaceParsePrice:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.alexandra_palace import AlexandraPalaceScraper
-        from bs4 import BeautifulSoup
-        self.scraper = AlexandraPalaceScraper()
-        self.BeautifulSoup = BeautifulSoup
-
-    def _make_card(self, text):
-        """Create a minimal BeautifulSoup Tag with the given text."""
-        return self.BeautifulSoup(f"<div>{text}</div>", "html.parser").find("div")
-
-    def test_free(self):
-        card = self._make_card("Free entry")
-        assert self.scraper._parse_price(card) == (0.0, 0.0)
+    def test_free(self, alexandra_palace_scraper, make_card):
+        card = make_card("Free entry")
+        assert alexandra_palace_scraper._parse_price(card) == (0.0, 0.0)
 
-    def test_price_range(self):
-        card = self._make_card("Tickets £25 - £75")
-        assert self.scraper._parse_price(card) == (25.0, 75.0)
+    def test_price_range(self, alexandra_palace_scraper, make_card):
+        card = make_card("Tickets £25 - £75")
+        assert alexandra_palace_scraper._parse_price(card) == (25.0, 75.0)
 
 
 # =====================================================================
 # Eventim Apollo
 # =====================================================================
 
-class TestEventimApolloParseDateText:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.eventim_apollo import EventimApolloScraper
-        self.scraper = EventimApolloScraper()
+@pytest.fixture(scope="module")
+def eventim_apollo_scraper():
+    from app.data_sources.scrapers.eventim_apollo import EventimApolloScraper
+    return EventimApolloScraper()
+
 
-    def test_ordinal_th(self):
-        assert self.scraper._parse_date_text("Friday 20th February 2026") == datetime(2026, 2, 20)
+class TestEventimApolloParseDateText:
+    def test_ordinal_th(self, eventim_apollo_scraper):
+        assert eventim_apollo_scraper._parse_date_text("Friday 20th February 2026") == datetime(2026, 2, 20)
 
-    def test_ordinal_st(self):
-        assert self.scraper._parse_date_text("Saturday 1st March 2026") == datetime(2026, 3, 1)
+    def test_ordinal_st(self, eventim_apollo_scraper):
+        assert eventim_apollo_scraper._parse_date_text("Saturday 1st March 2026") == datetime(2026, 3, 1)
 
-    def test_ordinal_nd(self):
-        assert self.scraper._parse_date_text("Monday 2nd March 2026") == datetime(2026, 3, 2)
+    def test_ordinal_nd(self, eventim_apollo_scraper):
+        assert eventim_apollo_scraper._parse_date_text("Monday 2nd March 2026") == datetime(2026, 3, 2)
 
-    def test_ordinal_rd(self):
-        assert self.scraper._parse_date_text("Wednesday 3rd March 2026") == datetime(2026, 3, 3)
+    def test_ordinal_rd(self, eventim_apollo_scraper):
+        assert eventim_apollo_scraper._parse_date_text("Wednesday 3rd March 2026") == datetime(2026, 3, 3)
 
-    def test_month_day_range(self):
-        result = self.scraper._parse_date_text("Feb 26th - Feb 27th 2026")
+    def test_month_day_range(self, eventim_apollo_scraper):
+        result = eventim_apollo_scraper._parse_date_text("Feb 26th - Feb 27th 2026")
         assert result == datetime(2026, 2, 26)
 
-    def test_empty_returns_none(self):
-        assert self.scraper._parse_date_text("") is None
+    def test_empty_returns_none(self, eventim_apollo_scraper):
+        assert eventim_apollo_scraper._parse_date_text("") is None
 
-    def test_no_year_returns_none(self):
-        assert self.scraper._parse_date_text("Friday 20th February") is None
+    def test_no_year_returns_none(self, eventim_apollo_scraper):
+        assert eventim_apollo_scraper._parse_date_text("Friday 20th February") is None
 
+    def test_invalid_day_returns_none(self, eventim_apollo_scraper):
+        assert eventim_apollo_scraper._parse_date_text("Tuesday 31st February 2026") is None
 
-class TestEventimApolloParsePrice:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.eventim_apollo import EventimApolloScraper
-        from bs4 import BeautifulSoup
-        self.scraper = EventimApolloScraper()
-        self.BeautifulSoup = BeautifulSoup
 
-    def _make_card(self, text):
-        return self.BeautifulSoup(f"<div>{text}</div>", "html.parser").find("div")
-
-    def test_free(self):
-        card = self._make_card("Free entry")
-        assert self.scraper._parse_price(card) == (0.0, 0.0)
+class TestEventimApolloParsePrice:
+    def test_free(self, eventim_apollo_scraper, make_card):
+        card = make_card("Free entry")
+        assert eventim_apollo_scraper._parse_price(card) == (0.0, 0.0)
 
-    def test_price_range(self):
-        card = self._make_card("Tickets £25.00 - £75.00")
-        assert self.scraper._parse_price(card) == (25.0, 75.0)
+    def test_price_range(self, eventim_apollo_scraper, make_card):
+        card = make_card("Tickets £25.00 - £75.00")
+        assert eventim_apollo_scraper._parse_price(card) == (25.0, 75.0)
 
 
 # =====================================================================
 # DICE
 # =====================================================================
 
-class TestDiceParseEvent:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.dice import DiceScraper
-        self.scraper = DiceScraper()
+@pytest.fixture(scope="module")
+def dice_scraper():
+    from app.data_sources.scrapers.dice import DiceScraper
+    return DiceScraper()
+
 
-    def test_valid_event(self):
+class TestDiceParseEvent:
+    def test_valid_event(self, dice_scraper):
         data = {
             "id": "abc123",
             "name": "Test Party",
@@ -312,38 +308,38 @@ class TestDiceParseEvent:
             "price": {"amount_from": 2500},
             "status": "on-sale",
         }
-        event = self.scraper._parse_event(data, "music", set())
+        event = dice_scraper._parse_event(data, "music", set())
         assert event is not None
         assert event.title == "Test Party"
         assert event.price_min == 25.0
         assert event.venue_name == "Test Venue"
 
-    def test_no_date_unix_returns_none(self):
+    def test_no_date_unix_returns_none(self, dice_scraper):
         data = {"id": "abc123", "name": "No Date"}
-        assert self.scraper._parse_event(data, "music", set()) is None
+        assert dice_scraper._parse_event(data, "music", set()) is None
 
-    def test_no_id_returns_none(self):
+    def test_no_id_returns_none(self, dice_scraper):
         data = {"name": "No ID", "date_unix": 1771020000}
-        assert self.scraper._parse_event(data, "music", set()) is None
+        assert dice_scraper._parse_event(data, "music", set()) is None
 
-    def test_price_in_pence(self):
+    def test_price_in_pence(self, dice_scraper):
         data = {
             "id": "p1",
             "name": "Pence Event",
             "date_unix": 1771020000,
             "price": {"amount_from": 1500},
         }
-        event = self.scraper._parse_event(data, "music", set())
+        event = dice_scraper._parse_event(data, "music", set())
         assert event.price_min == 15.0
 
-    def test_sold_out_status(self):
+    def test_sold_out_status(self, dice_scraper):
         data = {
             "id": "so1",
             "name": "Sold Event",
             "date_unix": 1771020000,
             "status": "sold-out",
         }
-        event = self.scraper._parse_event(data, "music", set())
+        event = dice_scraper._parse_event(data, "music", set())
         assert event.on_sale_status == "sold_out"
 
 
@@ -351,38 +347,39 @@ class TestDiceParseEvent:
 # Resident Advisor
 # =====================================================================
 
-class TestResidentAdvisorParseDate:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        from app.data_sources.scrapers.resident_advisor import ResidentAdvisorScraper
-        self.scraper = ResidentAdvisorScraper()
+@pytest.fixture(scope="module")
+def ra_scraper():
+    from app.data_sources.scrapers.resident_advisor import ResidentAdvisorScraper
+    return ResidentAdvisorScraper()
 
-    def test_unix_int(self):
-        result = self.scraper._parse_date(1771020000)
+
+class TestResidentAdvisorParseDate:
+    def test_unix_int(self, ra_scraper):
+        result = ra_scraper._parse_date(1771020000)
         assert isinstance(result, datetime)
 
-    def test_unix_float(self):
-        result = self.scraper._parse_date(1771020000.5)
+    def test_unix_float(self, ra_scraper):
+        result = ra_scraper._parse_date(1771020000.5)
         assert isinstance(result, datetime)
 
-    def test_iso_without_z(self):
-        result = self.scraper._parse_date("2026-02-14T22:00:00.000")
+    def test_iso_without_z(self, ra_scraper):
+        result = ra_scraper._parse_date("2026-02-14T22:00:00.000")
         assert result == datetime(2026, 2, 14, 22, 0, 0)
 
-    def test_iso_with_z(self):
-        result = self.scraper._parse_date("2026-02-14T22:00:00.000Z")
+    def test_iso_with_z(self, ra_scraper):
+        result = ra_scraper._parse_date("2026-02-14T22:00:00.000Z")
         assert result == datetime(2026, 2, 14, 22, 0, 0)
 
-    def test_date_only(self):
-        result = self.scraper._parse_date("2026-02-14")
+    def test_date_only(self, ra_scraper):
+        result = ra_scraper._parse_date("2026-02-14")
         assert result == datetime(2026, 2, 14)
 
-    def test_unix_as_string(self):
-        result = self.scraper._parse_date("1771020000")
+    def test_unix_as_string(self, ra_scraper):
+        result = ra_scraper._parse_date("1771020000")
         assert isinstance(result, datetime)
 
-    def test_none_returns_none(self):
-        assert self.scraper._parse_date(None) is None
+    def test_none_returns_none(self, ra_scraper):
+        assert ra_scraper._parse_date(None) is None
 
-    def test_garbage_returns_none(self):
-        assert self.scraper._parse_date("not-a-date-at-all") is None
+    def test_garbage_returns_none(self, ra_scraper):
+        assert ra_scraper._parse_date("not-a-date-at-all") is None
@@ -1,9 +1,10 @@
-"""Tests for SelloutDetector — pure logic, no DB needed."""
+"""Tests for SelloutDetector and SelloutMonitor."""
 import pytest
 from datetime import datetime, timedelta
 
-from app.models.database import EventStatus
+from app.models.database import AvailabilityHistory, EventStatus
 from app.services.sellout_detector import SelloutDetector
+from app.services.sellout_monitor import SelloutMonitor
 
 
 @pytest.fixture
@@ -26,6 +27,9 @@ class TestDetermineStatusSoldOut:
     def test_on_sale_status_sold_out_hyphen(self, detector):
         assert detector.determine_status(on_sale_status="sold-out") == EventStatus.SOLD_OUT
 
+    def test_on_sale_status_case_insensitive(self, detector):
+        assert detector.determine_status(on_sale_status="SoldOut") == EventStatus.SOLD_OUT
+
 
 # --- determine_status: CANCELLED ---
 
@@ -52,16 +56,30 @@ class TestDetermineStatusSellingFast:
 
     def test_rate_based_selling_fast(self, detector):
         """Projected sellout in <7 days should be SELLING_FAST."""
-        now = datetime.utcnow()
+        now = datetime(2026, 3, 1, 12, 0)
         result = detector.determine_status(
             tickets_available=100,
             total_tickets=10000,
             previous_availability=200,
             last_check=now - timedelta(days=1),
             event_date=now + timedelta(days=14),
+            now=now,
         )
         assert result == EventStatus.SELLING_FAST
 
+    def test_rate_based_slow_sales_not_selling_fast(self, detector):
+        """Projected sellout well after the event date stays UPCOMING."""
+        now = datetime(2026, 3, 1, 12, 0)
+        result = detector.determine_status(
+            tickets_available=9000,
+            total_tickets=10000,
+            previous_availability=9010,
+            last_check=now - timedelta(days=1),
+            event_date=now + timedelta(days=14),
+            now=now,
+        )
+        assert result == EventStatus.UPCOMING
+
 
 # --- determine_status: ON_SALE ---
 
@@ -166,3 +184,50 @@ class TestGetUrgencyMessage:
 
     def test_cancelled(self, detector):
         assert detector.get_urgency_message(EventStatus.CANCELLED) == "Cancelled"
+
+
+# --- SelloutMonitor.check_for_alerts ---
+
+class TestCheckForAlerts:
+    def _transition(self, db, event, new_status, recorded_at):
+        db.add(AvailabilityHistory(
+            event_id=event.id,
+            new_status=new_status,
+            recorded_at=recorded_at,
+        ))
+
+    def test_partitions_by_latest_transition(self, db_session, make_event):
+        now = datetime.utcnow()
+        future = now + timedelta(days=10)
+        fast_a = make_event(start_date=future, availability_percentage=8.0)
+        fast_b = make_event(start_date=future, availability_percentage=3.0)
+        gone = make_event(start_date=future)
+        recovered = make_event(start_date=future)
+        db_session.add_all([fast_a, fast_b, gone, recovered])
+        since = now - timedelta(hours=1)
+        self._transition(db_session, fast_a, EventStatus.SELLING_FAST, now)
+        self._transition(db_session, fast_b, EventStatus.SELLING_FAST, now)
+        self._transition(db_session, gone, EventStatus.SELLING_FAST, now - timedelta(minutes=30))
+        self._transition(db_session, gone, EventStatus.SOLD_OUT, now)
+        self._transition(db_session, recovered, EventStatus.SELLING_FAST, now - timedelta(minutes=30))
+        self._transition(db_session, recovered, EventStatus.ON_SALE, now)
+        db_session.commit()
+
+        result = SelloutMonitor().check_for_alerts(db_session, since=since)
+
+        assert [e.id for e in result.newly_selling_fast] == [fast_b.id, fast_a.id]
+        assert [e.id for e in result.newly_sold_out] == [gone.id]
+
+    def test_past_events_excluded(self, db_session, make_event):
+        now = datetime.utcnow()
+        past = make_event(start_date=now - timedelta(days=1))
+        db_session.add(past)
+        self._transition(db_session, past, EventStatus.SOLD_OUT, now)
+        db_session.commit()
+
+        result = SelloutMonitor().check_for_alerts(
+            db_session, since=now - timedelta(hours=1)
+        )
+
+        assert result.newly_sold_out == []
+        assert result.newly_selling_fast == []